@@ -4,40 +4,622 @@ import tempfile
 import sys
 import subprocess
 import time
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
 import threading
 import configparser
+import io
 from pathlib import Path
 import hashlib
+import base64
 import mimetypes
 import json
-from datetime import datetime, timedelta
+import heapq
+from operator import itemgetter
+import re
+from datetime import datetime
 import psutil
 import errno
 import platform
-from collections import defaultdict
+import queue
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from types import SimpleNamespace
 
 # Platform detection
 IS_WINDOWS = platform.system() == 'Windows'
 IS_MAC = platform.system() == 'Darwin'
 IS_LINUX = platform.system() == 'Linux'
 
+# The user's home/profile directory, looked up once
+HOME_DIR = os.environ.get("USERPROFILE", "") if IS_WINDOWS else os.path.expanduser("~")
+
 # Platform-specific imports
 if IS_WINDOWS:
     import ctypes
     import winreg
+elif IS_MAC:
+    import ctypes
+else:
+    import fcntl
 
 # Initialize configuration globally
 config = None
 
+# === Filesystem Helpers ===
+# Directories the GUI scan never descends into (Windows shell state, recycle bin),
+# compiled once so the per-directory check needs no lower() copy of the path
+EXCLUDED_SCAN_DIRS_RE = re.compile(r'appdata[\\/]local[\\/]microsoft[\\/]windows|ntuser|\$recycle',
+                                   re.IGNORECASE)
+EXCLUDED_SCAN_DIRS_BYTES_RE = re.compile(EXCLUDED_SCAN_DIRS_RE.pattern.encode(), re.IGNORECASE)
+
+# POSIX scans list directories as bytes so entry names are only decoded for
+# the files that are reported; Windows keeps its native str paths
+SCAN_AS_BYTES = not IS_WINDOWS
+
+def _is_excluded_scan_dir(path):
+    """Check if a directory should be skipped by the large file scan"""
+    if isinstance(path, bytes):
+        return EXCLUDED_SCAN_DIRS_BYTES_RE.search(path) is not None
+    return EXCLUDED_SCAN_DIRS_RE.search(path) is not None
+
+def _scan_dir(dirpath, subdirs, found, skip_dir=None, min_bytes=0, with_stat=False):
+    """List dirpath, appending (path, size) for regular files of at least
+    min_bytes to found and its subdirectories to subdirs. Returns the number
+    of regular files seen. DirEntry type checks come from the cached
+    directory listing, so only regular files cost a stat call. With
+    with_stat, the full stat result is appended in place of the size."""
+    count = 0
+    with os.scandir(dirpath) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if skip_dir is None or not skip_dir(entry.path):
+                        subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    count += 1
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_size >= min_bytes:
+                        found.append((os.fsdecode(entry.path), stat if with_stat else stat.st_size))
+            except (OSError, PermissionError):
+                continue
+    return count
+
+def _iter_files(top, skip_dir=None, onerror=None, progress=None, min_bytes=0, with_stat=False,
+                cancel=None):
+    """Walk top with os.scandir, yielding (path, size) for every regular file
+    of at least min_bytes, or (path, stat_result) with with_stat. onerror is
+    called with unreadable directories, progress with the number of files
+    seen in each directory. The walk stops early once the cancel event is set."""
+    stack = [os.fsencode(top) if SCAN_AS_BYTES else top]
+    while stack and not (cancel is not None and cancel.is_set()):
+        dirpath = stack.pop()
+        found = []
+        count = 0
+        try:
+            count = _scan_dir(dirpath, stack, found, skip_dir, min_bytes, with_stat)
+        except (OSError, PermissionError):
+            if onerror is not None:
+                onerror(os.fsdecode(dirpath))
+        yield from found
+        if progress is not None and count:
+            progress(count)
+
+def _iter_large_files(scan_paths, min_bytes, skip_dir=None, progress=None, with_stat=False,
+                      onerror=None, cancel=None):
+    """Yield (path, size) for files of at least min_bytes in scan_paths as
+    they are found.
+
+    Each scan path is listed once on the calling thread; its subdirectories
+    are then walked concurrently. os.scandir and stat release the GIL, so the
+    walk scales with the number of threads until the disk saturates. Walkers
+    put each match on a queue the moment they stat it, so results and
+    onerror calls arrive on the calling thread while the walk goes on.
+    progress may be called from worker threads. Setting the cancel event
+    stops every walker after the directory it is listing; so does closing
+    the generator (a consumer stopping early, or Ctrl-C), rather than
+    waiting for the remaining subtrees to be walked.
+    """
+    subtrees = []
+    
+    for base_path in scan_paths:
+        found = []
+        count = 0
+        try:
+            count = _scan_dir(os.fsencode(base_path) if SCAN_AS_BYTES else base_path,
+                              subtrees, found, skip_dir, min_bytes, with_stat)
+        except (OSError, PermissionError):
+            if onerror is not None:
+                onerror(base_path)
+        if progress is not None and count:
+            progress(count)
+        yield from found
+    
+    if subtrees:
+        # Walkers stop on the caller's cancel event or on this one, which is
+        # set when the generator is closed
+        stop = threading.Event()
+        if cancel is None:
+            walk_cancel = stop
+        else:
+            walk_cancel = SimpleNamespace(is_set=lambda: stop.is_set() or cancel.is_set())
+        
+        # Walkers report ('file', item), ('skipped', dirpath), ('error', exc)
+        # and finally ('done', None) for each subtree
+        results = queue.Queue()
+        found = SimpleNamespace(append=lambda item: results.put(('file', item)))
+        
+        def walk(top):
+            try:
+                stack = [top]
+                while stack and not walk_cancel.is_set():
+                    dirpath = stack.pop()
+                    try:
+                        count = _scan_dir(dirpath, stack, found, skip_dir, min_bytes, with_stat)
+                    except (OSError, PermissionError):
+                        results.put(('skipped', os.fsdecode(dirpath)))
+                        continue
+                    if progress is not None and count:
+                        progress(count)
+            except Exception as e:
+                results.put(('error', e))
+            finally:
+                results.put(('done', None))
+        
+        max_workers = min(16, (os.cpu_count() or 1) * 2)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = [executor.submit(walk, top) for top in subtrees]
+        try:
+            walking = len(futures)
+            while walking:
+                kind, value = results.get()
+                if kind == 'file':
+                    yield value
+                elif kind == 'skipped':
+                    if onerror is not None:
+                        onerror(value)
+                elif kind == 'error':
+                    raise value
+                else:
+                    walking -= 1
+        finally:
+            # Drop walks that haven't started and don't wait for running ones
+            stop.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+def _find_large_files_parallel(scan_paths, min_bytes, skip_dir=None, progress=None, with_stat=False,
+                               cancel=None):
+    """Find files of at least min_bytes in scan_paths as (large_files, skipped_dirs)"""
+    skipped_dirs = []
+    large_files = list(_iter_large_files(scan_paths, min_bytes, skip_dir, progress, with_stat,
+                                         skipped_dirs.append, cancel))
+    return large_files, skipped_dirs
+
+def _existing_paths(paths):
+    """Filter paths down to those that exist, keeping their order.
+
+    Paths are grouped by parent directory and each parent is listed once, so
+    checking many candidates under the same few directories costs a scandir
+    per parent instead of a stat per path; a missing parent rules out all of
+    its children at once. Windows and macOS compare names case-insensitively,
+    like their default filesystems. Parents are listed concurrently, so one
+    slow network or cloud-synced folder doesn't hold up the rest.
+    """
+    paths = list(paths)
+    by_parent = defaultdict(set)
+    for path in paths:
+        parent, name = os.path.split(os.path.normpath(path))
+        by_parent[parent].add(name)
+    
+    found = set()
+    if len(by_parent) < 2:
+        for parent, names in by_parent.items():
+            found.update(_existing_children(parent, names))
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(by_parent))) as executor:
+            for children in executor.map(_existing_children, by_parent.keys(), by_parent.values()):
+                found.update(children)
+    
+    return [path for path in paths if os.path.normpath(path) in found]
+
+def _existing_children(parent, names):
+    """The paths parent/name that exist, for the given names, from one listing of parent"""
+    if not parent or not all(names):
+        # Roots and relative names are cheap enough to stat directly
+        return [os.path.join(parent, name) for name in names
+                if os.path.exists(os.path.join(parent, name))]
+    try:
+        with os.scandir(parent) as it:
+            listing = set()
+            for entry in it:
+                # A symlink only counts if its target exists, as with os.path.exists
+                if not entry.is_symlink() or os.path.exists(entry.path):
+                    listing.add(entry.name if IS_LINUX else entry.name.casefold())
+    except OSError:
+        return []
+    return [os.path.join(parent, name) for name in names
+            if (name if IS_LINUX else name.casefold()) in listing]
+
+def _dir_identity(path, canon):
+    """(st_dev, st_ino) of a directory, or its canonical path where the
+    filesystem has no inode numbers (FAT) or it can't be stat-ed"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return canon
+    return (stat.st_dev, stat.st_ino) if stat.st_ino else canon
+
+def _collapse_nested(paths):
+    """Drop paths that lie inside another of the paths, or that name the same
+    directory as an earlier one, keeping order. A walk of the outer path
+    already covers them. Paths are compared by normcase(realpath()), so
+    symlinked and differently cased spellings count as the same, and by
+    device and inode, which also catches bind mounts."""
+    paths = list(paths)
+    canonical = [os.path.normcase(os.path.realpath(path)) for path in paths]
+    roots = set(canonical)
+    
+    kept = []
+    seen = set()
+    for path, canon in zip(paths, canonical):
+        identity = _dir_identity(path, canon)
+        if canon in seen or identity in seen:
+            continue
+        seen.add(canon)
+        seen.add(identity)
+        parent = os.path.dirname(canon)
+        while parent != canon:
+            if parent in roots:
+                break
+            canon, parent = parent, os.path.dirname(parent)
+        else:
+            kept.append(path)
+    return kept
+
+def _expand_wildcard(pattern):
+    """Expand a path with a single '*' directory component, like glob.glob but
+    with one scandir of the directory above it. Matches aren't checked for
+    existence past the wildcard; pass them through _existing_paths."""
+    head, _, tail = pattern.partition(os.sep + '*' + os.sep)
+    try:
+        with os.scandir(head) as it:
+            return [os.path.join(entry.path, tail) for entry in it
+                    if not entry.name.startswith('.') and entry.is_dir()]
+    except OSError:
+        return []
+
+# unlink/stat relative to an open directory descriptor (POSIX only)
+HAVE_DIR_FD = os.unlink in os.supports_dir_fd and os.scandir in os.supports_fd
+
+DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_CLOEXEC', 0)
+
+@contextmanager
+def _open_dir(path):
+    """Open a directory for dir_fd based calls, yielding None where unsupported"""
+    if not HAVE_DIR_FD:
+        yield None
+        return
+    fd = os.open(path, DIR_OPEN_FLAGS)
+    try:
+        yield fd
+    finally:
+        os.close(fd)
+
+def _is_protected_temp_dir(path):
+    """Check if a directory is a system location temp cleanup must not touch"""
+    return not IS_WINDOWS and ('/private/var' in path or '/System' in path)
+
+# Directory descriptors _purge_dir keeps open at once; deeper levels are
+# opened by path instead
+MAX_PURGE_DIR_FDS = 32
+
+def _open_purge_frame(path, entry, parent_fd, use_fd):
+    """Open and list a directory for _purge_dir as (path, fd, entries, entry).
+    entry is the directory's DirEntry in its parent, or None for the top."""
+    fd = None
+    if use_fd:
+        if parent_fd is None:
+            fd = os.open(path, DIR_OPEN_FLAGS)
+        else:
+            fd = os.open(entry.name, DIR_OPEN_FLAGS | getattr(os, 'O_NOFOLLOW', 0), dir_fd=parent_fd)
+    try:
+        # DirEntry.stat of an fd listing is an fstatat against that fd
+        with os.scandir(path if fd is None else fd) as it:
+            entries = list(it)
+    except BaseException:
+        if fd is not None:
+            os.close(fd)
+        raise
+    return path, fd, entries, entry
+
+def _purge_dir(path, progress=None):
+    """Delete the current user's files below path, removing emptied
+    subdirectories bottom-up. Returns the number of bytes freed.
+
+    The tree is walked with an explicit stack, so depth is not limited by
+    the recursion limit. The top directory is opened once; subdirectories
+    are opened relative to their parent, and entries are stat'ed and
+    unlinked relative to the open directory, so the kernel never resolves
+    the full path again. At most MAX_PURGE_DIR_FDS descriptors are open.
+    """
+    if _is_protected_temp_dir(path):
+        return 0
+    
+    # Only the current user's entries are removed (ownership isn't checked on Windows)
+    my_uid = None if IS_WINDOWS else os.getuid()
+    freed = 0
+    stack = [_open_purge_frame(path, None, None, HAVE_DIR_FD)]
+    try:
+        while stack:
+            dirpath, fd, entries, dir_entry = stack[-1]
+            
+            if not entries:
+                # Directory done: close it and remove it from its parent
+                stack.pop()
+                if fd is not None:
+                    os.close(fd)
+                if dir_entry is None:
+                    continue
+                parent_path, parent_fd = stack[-1][0], stack[-1][1]
+                try:
+                    # Only remove directories we own
+                    if my_uid is not None and dir_entry.stat(follow_symlinks=False).st_uid != my_uid:
+                        continue
+                    if parent_fd is None:
+                        os.rmdir(os.path.join(parent_path, dir_entry.name))
+                    else:
+                        os.rmdir(dir_entry.name, dir_fd=parent_fd)
+                except (OSError, PermissionError):
+                    pass
+                continue
+            
+            entry = entries.pop()
+            name = entry.path if fd is None else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    child = os.path.join(dirpath, entry.name)
+                    if not _is_protected_temp_dir(child):
+                        use_fd = HAVE_DIR_FD and len(stack) < MAX_PURGE_DIR_FDS
+                        stack.append(_open_purge_frame(child, entry, fd, use_fd))
+                else:
+                    if progress is not None:
+                        progress.update(1)
+                    stat = entry.stat(follow_symlinks=False)
+                    # On Unix systems, skip files we don't own
+                    if my_uid is not None and stat.st_uid != my_uid:
+                        continue
+                    os.unlink(name, dir_fd=fd)
+                    freed += stat.st_size
+            except (OSError, PermissionError):
+                continue
+    finally:
+        for frame in stack:
+            if frame[1] is not None:
+                os.close(frame[1])
+    
+    return freed
+
+def _is_file_in_use(filepath):
+    """Check if file is currently in use"""
+    try:
+        # Try to open the file with write access
+        with open(filepath, 'r+b'):
+            # If we can open it, it's not locked
+            return False
+    except OSError as e:
+        # On Windows, errno 13 = permission denied, 32 = sharing violation;
+        # a missing file can't be in use
+        return e.errno in (errno.EACCES, errno.EBUSY, 32)
+
+# Linux FICLONE ioctl, _IOW(0x94, 9, int); fcntl only exports it from Python 3.12
+FICLONE = 0x40049409
+
+if IS_MAC:
+    try:
+        _clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+        _clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    except (OSError, AttributeError):
+        _clonefile = None
+
+def _copy_range(fd_in, fd_out):
+    """Copy all of fd_in to fd_out without the data passing through Python.
+    Returns False if copy_file_range is unavailable (Python < 3.8), fails,
+    or stops before the end of the file"""
+    if not hasattr(os, 'copy_file_range'):
+        return False
+    size = os.fstat(fd_in).st_size
+    offset = 0
+    try:
+        while offset < size:
+            copied = os.copy_file_range(fd_in, fd_out, min(size - offset, 1 << 30))
+            if copied == 0:
+                break
+            offset += copied
+    except OSError:
+        return False
+    return offset >= size
+
+def _fast_copy(src, dst):
+    """Copy src to dst with its metadata, like shutil.copy2, except that an
+    existing dst is never replaced (FileExistsError is raised) and a failed
+    copy leaves no dst behind.
+
+    On APFS (clonefile) and Btrfs/XFS (FICLONE) the copy shares the source's
+    data blocks, so it is instant and takes no extra space. Other Linux
+    filesystems copy in the kernel with copy_file_range, and anything else
+    falls back to shutil.copy2.
+    """
+    if IS_MAC and _clonefile is not None:
+        if _clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+            return
+        if ctypes.get_errno() == errno.EEXIST:
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dst)
+    
+    # dst is claimed exclusively first, so copy2 below only ever
+    # overwrites the file this call created
+    cloned = False
+    with open(dst, 'xb') as fdst:
+        if IS_LINUX:
+            try:
+                with open(src, 'rb') as fsrc:
+                    try:
+                        fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                        cloned = True
+                    except OSError:
+                        cloned = _copy_range(fsrc.fileno(), fdst.fileno())
+            except OSError:
+                pass
+    try:
+        if cloned:
+            shutil.copystat(src, dst)
+        else:
+            # Also starts over after a partial kernel copy
+            shutil.copy2(src, dst)
+    except BaseException:
+        try:
+            os.unlink(dst)
+        except OSError:
+            pass
+        raise
+
+# Deletions below this count run sequentially; the pool is not worth starting
+PARALLEL_DELETE_MIN_FILES = 32
+# Deletions of at least this many files are grouped by parent directory
+BATCH_UNLINK_MIN_FILES = 256
+DELETE_MAX_IN_FLIGHT = 64
+
+def _delete_workers(config):
+    """Thread count for deletions, backups and trash moves, from the
+    delete_workers setting; kept low by default so that copies on a
+    spinning disk don't compete for the head"""
+    return max(1, config.getint('Settings', 'delete_workers', 4))
+
+def _remove_file(filepath, size, on_result):
+    """Remove one file and report (filepath, size, error) to on_result"""
+    try:
+        os.remove(filepath)
+    except Exception as e:
+        on_result(filepath, size, e)
+    else:
+        on_result(filepath, size, None)
+
+def _remove_dir_batch(parent, files, on_result):
+    """Unlink files that share the directory parent relative to one open
+    descriptor, so the kernel resolves the parent path only once"""
+    try:
+        with _open_dir(parent) as fd:
+            for filepath, size in files:
+                try:
+                    os.unlink(os.path.basename(filepath), dir_fd=fd)
+                except Exception as e:
+                    on_result(filepath, size, e)
+                else:
+                    on_result(filepath, size, None)
+    except (OSError, PermissionError):
+        for filepath, size in files:
+            _remove_file(filepath, size, on_result)
+
+def _remove_files(files, on_result, workers=None):
+    """Remove (filepath, size) pairs, calling on_result(filepath, size, error)
+    for each one; error is None on success.
+    
+    os.remove releases the GIL, so larger batches are unlinked on a thread
+    pool sized by workers, or else by the delete_workers setting. At most
+    DELETE_MAX_IN_FLIGHT tasks are queued at once, and on_result is then
+    called from worker threads; an exception it raises is re-raised here
+    once the pool is done. Very large batches are grouped by parent
+    directory and unlinked relative to its descriptor.
+    """
+    if len(files) < PARALLEL_DELETE_MIN_FILES:
+        for filepath, size in files:
+            _remove_file(filepath, size, on_result)
+        return
+    
+    in_flight = threading.BoundedSemaphore(DELETE_MAX_IN_FLIGHT)
+    errors = []
+    
+    def run(func, *args):
+        try:
+            func(*args, on_result)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            in_flight.release()
+    
+    if HAVE_DIR_FD and len(files) >= BATCH_UNLINK_MIN_FILES:
+        by_parent = defaultdict(list)
+        for filepath, size in files:
+            by_parent[os.path.dirname(filepath)].append((filepath, size))
+        tasks = [(_remove_dir_batch, parent, group) for parent, group in by_parent.items()]
+    else:
+        tasks = [(_remove_file, filepath, size) for filepath, size in files]
+    
+    if workers is None:
+        workers = _delete_workers(get_config())
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for task in tasks:
+            in_flight.acquire()
+            executor.submit(run, *task)
+    if errors:
+        raise errors[0]
+
 # === File Safety and Analysis ===
+# Path substrings used by FileAnalyzer.assess_safety, matched against the lowercased path
+if IS_WINDOWS:
+    SAFE_PATH_PATTERNS = (
+        '\\temp\\', '\\tmp\\', '\\cache\\', '\\caches\\',
+        '\\temporary internet files\\', '\\thumbnails\\',
+        'crashdumps', 'crash reports', '\\logs\\'
+    )
+    SAFE_PATH_LOCATIONS = (
+        'pip\\cache', 'npm-cache', 'nuget\\packages',
+        'crashdumps', 'server-cache', 'dxcache',
+        'shader_cache', 'gputemp', 'fontcache'
+    )
+    USER_PATH_PATTERNS = ('\\downloads\\', '\\documents\\', '\\desktop\\', '\\videos\\', '\\music\\')
+else:
+    # macOS/Linux patterns
+    SAFE_PATH_PATTERNS = (
+        '/temp/', '/tmp/', '/cache/', '/caches/',
+        '/.cache/', '/thumbnails/', '/logs/',
+        'crashdumps', 'crash reports'
+    )
+    SAFE_PATH_LOCATIONS = (
+        'pip/cache', 'npm-cache', '.npm/', '.cache/',
+        'crashdumps', 'server-cache', 'Cache/',
+        'shader_cache', 'gputemp', 'fontcache',
+        '.Trash/', 'Trash/'
+    )
+    USER_PATH_PATTERNS = ('/downloads/', '/documents/', '/desktop/', '/movies/', '/music/', '/pictures/')
+
+# File name fragments assess_safety treats as system files
+SYSTEM_FILE_MARKERS = ('.dll', '.sys', '.ocx')
+
+# Markers for each safety level in CLI listings
+SAFETY_ICONS = {'safe': '✓', 'user': '?', 'unknown': '!', 'critical': '✗'}
+
+# A path with the lowercased forms FileAnalyzer matches against
+PathView = namedtuple('PathView', 'path path_lower filename ext')
+
+def _path_view(filepath):
+    """Lowercase a path, its file name and extension once (PathViews pass through)"""
+    if isinstance(filepath, PathView):
+        return filepath
+    path_lower = filepath.lower()
+    filename = os.path.basename(path_lower)
+    return PathView(filepath, path_lower, filename, os.path.splitext(filename)[1])
+
 class FileAnalyzer:
     """Analyze files for safety and categorization"""
     
     def __init__(self):
-        self.critical_paths = self._get_critical_paths()
-        self.running_processes = self._get_running_processes()
+        # One pass over the process table serves both lookups
+        self.running_processes, exe_dirs = self._get_running_processes()
+        self.critical_paths = self._get_critical_paths(exe_dirs)
+        # Parent directory prefix -> True, or the critical paths that extend past it
+        self._critical_by_dir = {}
         self.file_categories = {
             'system': ['.dll', '.sys', '.ocx', '.lib'],
             'media': ['.mp4', '.avi', '.mkv', '.mov', '.wmv', '.mp3', '.wav', '.flac', '.m4a', '.aac'],
@@ -56,8 +638,17 @@ class FileAnalyzer:
             'cache_patterns': ['cache', 'Cache', 'temp', 'Temp', 'tmp', '_cacache', 'node_modules', 'thumbcache']
         }
         
-    def _get_critical_paths(self):
-        """Get paths that should never be deleted"""
+        # Extension lookup for categorize_file; the first category listing
+        # an extension wins, as with a scan of file_categories in order
+        self.category_by_ext = {}
+        for category, extensions in self.file_categories.items():
+            if category != 'cache_patterns':
+                for ext in extensions:
+                    self.category_by_ext.setdefault(ext, category)
+        
+    def _get_critical_paths(self, exe_dirs=()):
+        """Get paths that should never be deleted, given the lowercased
+        directories of running executables"""
         critical = set()
         
         if IS_WINDOWS:
@@ -117,33 +708,32 @@ class FileAnalyzer:
             system_dirs = {'/bin', '/sbin', '/usr', '/lib', '/etc', '/opt'}
         
         # Protect running process directories in system locations
-        for proc in psutil.process_iter(['pid', 'name', 'exe']):
-            try:
-                if proc.info['exe']:
-                    exe_dir = os.path.dirname(proc.info['exe']).lower()
-                    # Only add if it's in a system directory
-                    if any(exe_dir.startswith(sys_dir.lower()) for sys_dir in system_dirs):
-                        critical.add(exe_dir)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        system_dirs = tuple(sys_dir.lower() for sys_dir in system_dirs)
+        for exe_dir in exe_dirs:
+            # Only add if it's in a system directory
+            if exe_dir.startswith(system_dirs):
+                critical.add(exe_dir)
                 
         return critical
         
     def _get_running_processes(self):
-        """Get list of currently running process names"""
+        """Get the lowercased names and executable directories of running processes"""
         processes = set()
-        for proc in psutil.process_iter(['name']):
+        exe_dirs = set()
+        for proc in psutil.process_iter(['name', 'exe']):
             try:
-                processes.add(proc.info['name'].lower())
+                info = proc.info
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
-        return processes
+            if info['name']:
+                processes.add(info['name'].lower())
+            if info['exe']:
+                exe_dirs.add(os.path.dirname(info['exe']).lower())
+        return processes, exe_dirs
         
     def categorize_file(self, filepath):
-        """Categorize a file based on its path and extension"""
-        path_lower = filepath.lower()
-        ext = os.path.splitext(filepath)[1].lower()
-        filename = os.path.basename(filepath).lower()
+        """Categorize a file (path or PathView) based on its path and extension"""
+        _, path_lower, filename, ext = _path_view(filepath)
         
         # Check for specific path patterns first
         if any(pattern in path_lower for pattern in self.file_categories['cache_patterns']):
@@ -196,9 +786,9 @@ class FileAnalyzer:
                 return 'executables'
                 
         # Check by file extension
-        for category, extensions in self.file_categories.items():
-            if category != 'cache_patterns' and ext in extensions:
-                return category
+        category = self.category_by_ext.get(ext)
+        if category:
+            return category
                 
         # Additional categorization for files without clear extensions
         if 'model' in filename or 'weights' in filename:
@@ -209,21 +799,15 @@ class FileAnalyzer:
         return 'other'
         
     def assess_safety(self, filepath):
-        """Assess the safety of deleting a file"""
-        path_lower = filepath.lower()
-        filename = os.path.basename(filepath).lower()
+        """Assess the safety of deleting a file (path or PathView)"""
+        _, path_lower, filename, _ = _path_view(filepath)
         
         # Critical - check if file is actually INSIDE a critical directory
-        for critical_path in self.critical_paths:
-            if path_lower.startswith(critical_path):
-                return 'critical'
-                
-        # Check if file is currently in use
-        if self._is_file_in_use(filepath):
-            return 'in_use'
+        if self._is_critical(path_lower):
+            return 'critical'
             
         # System files
-        if any(sys_ext in filename for sys_ext in ['.dll', '.sys', '.ocx']):
+        if any(sys_ext in filename for sys_ext in SYSTEM_FILE_MARKERS):
             return 'system'
             
         # Running executables
@@ -231,41 +815,14 @@ class FileAnalyzer:
             return 'running'
             
         # Safe to delete - platform-specific patterns
-        if IS_WINDOWS:
-            safe_patterns = [
-                '\\temp\\', '\\tmp\\', '\\cache\\', '\\caches\\',
-                '\\temporary internet files\\', '\\thumbnails\\',
-                'crashdumps', 'crash reports', '\\logs\\'
-            ]
-            safe_locations = [
-                'pip\\cache', 'npm-cache', 'nuget\\packages',
-                'crashdumps', 'server-cache', 'dxcache',
-                'shader_cache', 'gputemp', 'fontcache'
-            ]
-            user_patterns = ['\\downloads\\', '\\documents\\', '\\desktop\\', '\\videos\\', '\\music\\']
-        else:
-            # macOS/Linux patterns
-            safe_patterns = [
-                '/temp/', '/tmp/', '/cache/', '/caches/',
-                '/.cache/', '/thumbnails/', '/logs/',
-                'crashdumps', 'crash reports'
-            ]
-            safe_locations = [
-                'pip/cache', 'npm-cache', '.npm/', '.cache/',
-                'crashdumps', 'server-cache', 'Cache/',
-                'shader_cache', 'gputemp', 'fontcache',
-                '.Trash/', 'Trash/'
-            ]
-            user_patterns = ['/downloads/', '/documents/', '/desktop/', '/movies/', '/music/', '/pictures/']
-            
-        if any(pattern in path_lower for pattern in safe_patterns):
+        if any(pattern in path_lower for pattern in SAFE_PATH_PATTERNS):
             return 'safe'
             
-        if any(location in path_lower for location in safe_locations):
+        if any(location in path_lower for location in SAFE_PATH_LOCATIONS):
             return 'safe'
             
         # User files (generally safe but need confirmation)
-        if any(user_pattern in path_lower for user_pattern in user_patterns):
+        if any(user_pattern in path_lower for user_pattern in USER_PATH_PATTERNS):
             return 'user'
             
         # Game/app data that might be safe to delete
@@ -274,46 +831,75 @@ class FileAnalyzer:
             
         return 'unknown'
         
-    def _is_file_in_use(self, filepath):
-        """Check if file is currently in use"""
-        if not os.path.exists(filepath):
-            return False  # Can't be in use if it doesn't exist
-            
-        try:
-            # Try to open the file with write access
-            with open(filepath, 'r+b') as f:
-                # If we can open it, it's not locked
-                return False
-        except (OSError, IOError) as e:
-            # On Windows, errno 13 = permission denied, 32 = sharing violation
-            if hasattr(e, 'errno') and e.errno in (errno.EACCES, errno.EBUSY, 32):
-                return True
-            # For other errors, assume file is accessible
-            return False
-            
-    def get_file_info(self, filepath):
-        """Get comprehensive file information"""
+    def _is_critical(self, path_lower):
+        """Check whether path_lower starts with a critical path, memoized per parent directory"""
+        cut = path_lower.rfind(os.sep) + 1
+        prefix = path_lower[:cut]
+        verdict = self._critical_by_dir.get(prefix)
+        if verdict is None:
+            # A critical path that prefixes the directory matches every file in
+            # it; only critical paths extending past the directory depend on
+            # the file name, and any other critical path can never match
+            if any(prefix.startswith(critical_path) for critical_path in self.critical_paths):
+                verdict = True
+            else:
+                verdict = tuple(critical_path for critical_path in self.critical_paths
+                                if critical_path.startswith(prefix))
+            self._critical_by_dir[prefix] = verdict
+        return verdict is True or any(path_lower.startswith(critical_path) for critical_path in verdict)
+        
+    def get_file_info(self, filepath, stat=None):
+        """Get comprehensive file information, reusing stat if already known"""
         try:
-            stat = os.stat(filepath)
+            if stat is None:
+                stat = os.stat(filepath)
+            # Lowercased once for both classifiers
+            view = _path_view(filepath)
             return {
                 'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime),
-                'created': datetime.fromtimestamp(stat.st_ctime),
-                'accessed': datetime.fromtimestamp(stat.st_atime),
-                'category': self.categorize_file(filepath),
-                'safety': self.assess_safety(filepath),
+                'modified': stat.st_mtime,  # seconds since the epoch
+                'category': self.categorize_file(view),
+                'safety': self.assess_safety(view),
                 'mime_type': mimetypes.guess_type(filepath)[0] or 'unknown'
             }
         except (OSError, PermissionError):
             return None
 
+# A FileAnalyzer snapshots the running processes when built; scans within
+# this many seconds of each other share one
+ANALYZER_TTL = 30.0
+_analyzer = None
+_analyzer_built = 0.0
+_analyzer_lock = threading.Lock()
+
+def get_file_analyzer(refresh=False):
+    """Return the shared FileAnalyzer, rebuilding it when older than
+    ANALYZER_TTL seconds or when refresh is set"""
+    global _analyzer, _analyzer_built
+    with _analyzer_lock:
+        now = time.monotonic()
+        if refresh or _analyzer is None or now - _analyzer_built > ANALYZER_TTL:
+            _analyzer = FileAnalyzer()
+            _analyzer_built = now
+        return _analyzer
+
+# Files handed to one PowerShell/osascript/gio process when trashing in bulk;
+# keeps each command line well under the Windows 32K character limit
+RECYCLE_BATCH_SIZE = 32
+# The GUI hands deletions to delete_many this many files at a time, updating
+# its progress bar in between
+GUI_DELETE_CHUNK = 64
+
 class SafeDeleteManager:
     """Manage safe file deletion with backups and recovery"""
     
     def __init__(self, config):
         self.config = config
         self.backup_dir = os.path.join(tempfile.gettempdir(), 'cScan_backups')
-        self.deleted_files_log = os.path.join(self.backup_dir, 'deleted_files.json')
+        # One JSON object per line, so logging a deletion is a single append
+        self.deleted_files_log = os.path.join(self.backup_dir, 'deleted_files.jsonl')
+        # delete_many may call safe_delete from several threads at once
+        self._log_lock = threading.Lock()
         self.ensure_backup_dir()
         
     def ensure_backup_dir(self):
@@ -323,26 +909,18 @@ class SafeDeleteManager:
             
     def safe_delete(self, filepath, file_info):
         """Safely delete a file with backup option"""
-        if not os.path.exists(filepath):
-            return False, "File not found"
-            
         # Check if we're in dry run mode
         if self.config.getboolean('Settings', 'dry_run_mode', False):
+            if not os.path.exists(filepath):
+                return False, "File not found"
             return True, f"[DRY RUN] Would delete: {filepath}"
             
-        # Check safety level
-        if file_info['safety'] in ['critical', 'system', 'running', 'in_use']:
-            # Check if user wants to override safety
-            if self.config.getboolean('Settings', 'override_safety', False):
-                print(f"WARNING: Overriding safety for {file_info['safety']} file: {os.path.basename(filepath)}")
-            else:
-                return False, f"File is {file_info['safety']} - deletion blocked for safety"
-            
-        # Create backup if enabled
-        if self.config.getboolean('Settings', 'backup_before_delete', False):
-            backup_path = self._create_backup(filepath)
-            if not backup_path:
-                return False, "Failed to create backup"
+        # A missing file is reported by the steps below failing, rather
+        # than by a separate existence check up front
+        # Check safety level and create backup if enabled
+        problem = self._prepare_delete(filepath, file_info)
+        if problem:
+            return False, problem
                 
         try:
             # Move to recycle bin instead of permanent deletion
@@ -355,25 +933,198 @@ class SafeDeleteManager:
             self._log_deletion(filepath, file_info)
             return True, "File deleted successfully"
             
+        except FileNotFoundError:
+            return False, "File not found"
         except Exception as e:
             return False, f"Error deleting file: {str(e)}"
             
+    def _prepare_delete(self, filepath, file_info):
+        """Apply the safety check and optional backup that precede a deletion.
+        Returns why the file must not be deleted, or None"""
+        blocked = self._safety_block(filepath, file_info)
+        if blocked:
+            return blocked
+        if self.config.getboolean('Settings', 'backup_before_delete', False):
+            if not self._create_backup(filepath):
+                return "Failed to create backup" if os.path.lexists(filepath) else "File not found"
+        return None
+    
+    def _safety_block(self, filepath, file_info):
+        """Return why the file's safety level blocks deletion, or None"""
+        safety = file_info['safety']
+        # Scanning doesn't open files, so whether one is in use is only
+        # checked here, for files that are actually about to be deleted
+        if safety not in ['critical', 'system', 'running'] and _is_file_in_use(filepath):
+            safety = 'in_use'
+        if safety in ['critical', 'system', 'running', 'in_use']:
+            # Check if user wants to override safety
+            if self.config.getboolean('Settings', 'override_safety', False):
+                print(f"WARNING: Overriding safety for {safety} file: {os.path.basename(filepath)}")
+            else:
+                return f"File is {safety} - deletion blocked for safety"
+        return None
+    
+    def delete_many(self, files):
+        """Safely delete several files (file_info dicts with a 'path' key).
+        Returns (file_info, success, message) tuples in input order.
+
+        With recycle bin, backup and dry run all off, deletion is a plain
+        unlink, so the batch goes through _remove_files, which unlinks
+        large batches directory by directory on a thread pool. Recycle bin
+        moves are batched through _move_many_to_recycle_bin. Otherwise each
+        file goes through safe_delete, several files at a time, since
+        backups mostly wait on I/O.
+        """
+        if self.config.getboolean('Settings', 'dry_run_mode', False):
+            return [(file_info,) + self.safe_delete(file_info['path'], file_info) for file_info in files]
+        
+        if self.config.getboolean('Settings', 'use_recycle_bin', True):
+            return self._recycle_many(files)
+        
+        if self.config.getboolean('Settings', 'backup_before_delete', False):
+            def delete_one(file_info):
+                return (file_info,) + self.safe_delete(file_info['path'], file_info)
+            
+            if len(files) < 2:
+                return [delete_one(file_info) for file_info in files]
+            with ThreadPoolExecutor(max_workers=self._workers()) as executor:
+                return list(executor.map(delete_one, files))
+        
+        # Outcomes are kept per input entry. A path listed more than once is
+        # unlinked for its first entry; later entries report what deleting
+        # it again would: the file is gone, or the same error
+        outcome = [None] * len(files)
+        first = {}
+        to_remove = []
+        for index, file_info in enumerate(files):
+            filepath = file_info['path']
+            blocked = self._safety_block(filepath, file_info)
+            if blocked:
+                outcome[index] = (False, blocked)
+            elif filepath not in first:
+                first[filepath] = index
+                to_remove.append((filepath, file_info['size']))
+        
+        def on_result(filepath, size, error):
+            index = first[filepath]
+            if error is None:
+                outcome[index] = (True, "File deleted successfully")
+            elif isinstance(error, FileNotFoundError):
+                outcome[index] = (False, "File not found")
+            else:
+                outcome[index] = (False, f"Error deleting file: {str(error)}")
+        
+        _remove_files(to_remove, on_result, self._workers())
+        
+        results = []
+        for index, file_info in enumerate(files):
+            if outcome[index] is None:
+                success, message = outcome[first[file_info['path']]]
+                outcome[index] = (False, "File not found") if success else (success, message)
+            success, message = outcome[index]
+            if success:
+                self._log_deletion(file_info['path'], file_info)
+            results.append((file_info, success, message))
+        return results
+            
+    def _workers(self):
+        """Thread count for this manager's deletions, backups and checks"""
+        return _delete_workers(self.config)
+            
     def _create_backup(self, filepath):
         """Create a backup of the file"""
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_filename = f"{os.path.basename(filepath)}_{timestamp}"
-            backup_path = os.path.join(self.backup_dir, backup_filename)
-            shutil.copy2(filepath, backup_path)
-            return backup_path
+            base_path = backup_path = os.path.join(self.backup_dir, backup_filename)
+            # Same-named files backed up within the same second (possibly
+            # concurrently, from delete_many) get a counter suffix
+            copies = 1
+            while True:
+                try:
+                    _fast_copy(filepath, backup_path)
+                    return backup_path
+                except FileExistsError:
+                    copies += 1
+                    backup_path = f"{base_path}_{copies}"
         except Exception:
             return None
             
+    def _recycle_many(self, files):
+        """delete_many in recycle bin mode: checks and backups run per file,
+        then the files that passed are moved to the trash in batches"""
+        def prepare(file_info):
+            if not os.path.exists(file_info['path']):
+                return "File not found"
+            return self._prepare_delete(file_info['path'], file_info)
+        
+        with ThreadPoolExecutor(max_workers=self._workers()) as executor:
+            problems = list(executor.map(prepare, files))
+        
+        to_trash = [file_info['path'] for file_info, problem in zip(files, problems) if not problem]
+        errors = self._move_many_to_recycle_bin(to_trash)
+        
+        results = []
+        for file_info, problem in zip(files, problems):
+            filepath = file_info['path']
+            if problem:
+                results.append((file_info, False, problem))
+            elif filepath in errors:
+                results.append((file_info, False, f"Error deleting file: {str(errors[filepath])}"))
+            else:
+                self._log_deletion(filepath, file_info)
+                results.append((file_info, True, "File deleted successfully"))
+        return results
+    
+    def _move_many_to_recycle_bin(self, paths):
+        """Move files to recycle bin/trash, one helper process per
+        RECYCLE_BATCH_SIZE files. Files a batch leaves behind go through
+        _move_to_recycle_bin one by one. Returns {path: exception} for failures."""
+        errors = {}
+        for start in range(0, len(paths), RECYCLE_BATCH_SIZE):
+            batch = paths[start:start + RECYCLE_BATCH_SIZE]
+            try:
+                self._trash_batch(batch)
+            except (subprocess.CalledProcessError, OSError):
+                pass  # Retried file by file below
+            for filepath in batch:
+                if os.path.lexists(filepath):
+                    try:
+                        self._move_to_recycle_bin(filepath)
+                    except Exception as e:
+                        errors[filepath] = e
+        return errors
+    
+    def _trash_batch(self, paths):
+        """Move several files to recycle bin/trash with a single helper process"""
+        if IS_WINDOWS:
+            if _recycle_native(paths):
+                return
+            # Passed as -EncodedCommand (UTF-16LE, base64) so any path survives quoting
+            quoted = ", ".join("'" + p.replace("'", "''") + "'" for p in paths)
+            script = ("Add-Type -AssemblyName Microsoft.VisualBasic; "
+                      f"foreach ($f in @({quoted})) {{ try {{ "
+                      "[Microsoft.VisualBasic.FileIO.FileSystem]::DeleteFile($f, 'OnlyErrorDialogs', 'SendToRecycleBin') "
+                      "} catch {} }")
+            encoded = base64.b64encode(script.encode('utf-16-le')).decode('ascii')
+            subprocess.run(["powershell.exe", "-NoProfile", "-EncodedCommand", encoded],
+                           check=True, capture_output=True)
+        elif IS_MAC:
+            files = ", ".join('POSIX file "' + p.replace('\\', '\\\\').replace('"', '\\"') + '"' for p in paths)
+            subprocess.run([
+                "osascript", "-e",
+                f'tell application "Finder" to move {{{files}}} to trash'
+            ], check=True, capture_output=True)
+        else:
+            subprocess.run(["gio", "trash"] + list(paths), check=True, capture_output=True)
+    
     def _move_to_recycle_bin(self, filepath):
         """Move file to recycle bin/trash"""
         try:
             if IS_WINDOWS:
-                # Windows: Use PowerShell to move to recycle bin
+                # Windows: Ask the shell directly, or use PowerShell to move to recycle bin
+                if _recycle_native([filepath]):
+                    return
                 subprocess.run([
                     "powershell.exe", "-Command",
                     f"Add-Type -AssemblyName Microsoft.VisualBasic; [Microsoft.VisualBasic.FileIO.FileSystem]::DeleteFile('{filepath}', 'OnlyErrorDialogs', 'SendToRecycleBin')"
@@ -415,19 +1166,11 @@ class SafeDeleteManager:
                 'category': file_info['category'],
                 'safety': file_info['safety']
             }
+            line = json.dumps(log_entry) + '\n'
             
-            # Load existing log
-            if os.path.exists(self.deleted_files_log):
-                with open(self.deleted_files_log, 'r') as f:
-                    log_data = json.load(f)
-            else:
-                log_data = {'deletions': []}
-                
-            log_data['deletions'].append(log_entry)
-            
-            # Save updated log
-            with open(self.deleted_files_log, 'w') as f:
-                json.dump(log_data, f, indent=2)
+            with self._log_lock:
+                with open(self.deleted_files_log, 'a') as f:
+                    f.write(line)
                 
         except Exception:
             pass  # Don't fail deletion if logging fails
@@ -437,57 +1180,110 @@ class SmartFileScanner:
     
     def __init__(self, config):
         self.config = config
-        self.analyzer = FileAnalyzer()
         self.file_cache = {}
+    
+    @property
+    def analyzer(self):
+        """The shared FileAnalyzer; only scanning needs one"""
+        return get_file_analyzer()
         
     def scan_files(self, scan_paths, min_size_mb=100, callback=None):
         """Scan files with enhanced analysis"""
         large_files = []
         file_data = defaultdict(list)
-        total_files = 0
         
-        # Count files first
-        if callback:
-            callback("Counting files...")
-            
-        for path in scan_paths:
-            for root, _, files in os.walk(path):
-                total_files += len(files)
-                
-        processed = 0
+        for file_info in self.iter_large_files(scan_paths, min_size_mb, callback):
+            large_files.append(file_info)
+            file_data[file_info['category']].append(file_info)
+                        
+        return large_files, file_data
+    
+    def iter_large_files(self, scan_paths, min_size_mb=100, callback=None):
+        """Yield analyzed file info for each large file as the scan finds it.
+        The tree is walked once, so progress is a running count of files
+        checked rather than a percentage."""
+        processed = [0]
+        lock = threading.Lock()
         min_size_bytes = min_size_mb * 1024 * 1024
         
+        # Called from the walker threads
+        def on_progress(count):
+            with lock:
+                processed[0] += count
+                if callback:
+                    callback(f"Scanning files: {processed[0]:,} checked")
+        
+        analyzer = self.analyzer
+        safe_roots = self._safe_roots(scan_paths, analyzer)
+        
+        # The walk stats every file once and only hands back files over the
+        # threshold with their stat, so the analyzer neither sees the small
+        # ones nor stats the large ones again
+        for filepath, stat in _iter_large_files(scan_paths, min_size_bytes, progress=on_progress,
+                                                with_stat=True):
+            if safe_roots and filepath.startswith(safe_roots) and not self._needs_analysis(filepath):
+                yield self._tree_file_info(filepath, stat, 'cache', 'safe')
+                continue
+            file_info = analyzer.get_file_info(filepath, stat)
+            if file_info:
+                file_info['path'] = filepath
+                yield file_info
+    
+    @staticmethod
+    def _tree_file_info(filepath, stat, category, safety):
+        """File info for a file whose category and safety follow from its tree"""
+        return {
+            'path': filepath,
+            'size': stat.st_size,
+            'modified': stat.st_mtime,
+            'category': category,
+            'safety': safety
+        }
+    
+    @staticmethod
+    def _safe_roots(scan_paths, analyzer):
+        """The scan paths whose own location already makes categorize_file
+        say 'cache' and assess_safety say 'safe' for every file below them,
+        as a tuple of prefixes ending in a separator"""
+        roots = []
         for path in scan_paths:
-            for root, _, files in os.walk(path):
-                for file in files:
-                    if callback:
-                        callback(f"Scanning files: {(processed/total_files)*100:.1f}%")
-                    
-                    filepath = os.path.join(root, file)
-                    processed += 1
-                    
-                    try:
-                        file_size = os.path.getsize(filepath)
-                        if file_size >= min_size_bytes:
-                            file_info = self.analyzer.get_file_info(filepath)
-                            if file_info:
-                                file_info['path'] = filepath
-                                large_files.append(file_info)
-                                file_data[file_info['category']].append(file_info)
-                    except (OSError, PermissionError):
-                        continue
-                        
-        return large_files, file_data
+            root = os.path.join(path, '') if path else ''
+            root_lower = root.lower()
+            if not root_lower:
+                continue
+            if not any(pattern in root_lower for pattern in analyzer.file_categories['cache_patterns']):
+                continue
+            if not any(pattern in root_lower for pattern in SAFE_PATH_PATTERNS + SAFE_PATH_LOCATIONS):
+                continue
+            # A critical path above or inside the tree makes it per-file work again
+            if any(root_lower.startswith(critical_path) or critical_path.startswith(root_lower)
+                   for critical_path in analyzer.critical_paths):
+                continue
+            roots.append(root)
+        return tuple(roots)
+    
+    @staticmethod
+    def _needs_analysis(filepath):
+        """Whether a file's name alone can make assess_safety say system or running"""
+        filename = os.path.basename(filepath).lower()
+        return filename.endswith('.exe') or any(marker in filename for marker in SYSTEM_FILE_MARKERS)
         
     def get_smart_suggestions(self, file_data):
         """Generate smart cleanup suggestions"""
         suggestions = []
         
+        get_size = itemgetter('size')
+        
+        # Age cutoffs as timestamps, comparable with file_info['modified']
+        now = time.time()
+        week_ago = now - 7 * 24 * 3600
+        month_ago = now - 30 * 24 * 3600
+        
         # Cache files (highest priority - usually safe)
         if 'cache' in file_data:
             cache_files = [f for f in file_data['cache'] if f['safety'] in ['safe', 'unknown']]
             if cache_files:
-                total_size = sum(f['size'] for f in cache_files)
+                total_size = sum(map(get_size, cache_files))
                 suggestions.append({
                     'category': 'cache',
                     'description': 'Cache files (can be regenerated)',
@@ -500,12 +1296,14 @@ class SmartFileScanner:
         if 'temp' in file_data:
             temp_files = [f for f in file_data['temp'] if f['safety'] in ['safe', 'unknown']]
             if temp_files:
-                # Split into old and recent
-                old_temp = [f for f in temp_files if f['modified'] < datetime.now() - timedelta(days=7)]
-                recent_temp = [f for f in temp_files if f['modified'] >= datetime.now() - timedelta(days=7)]
+                # Split into old and recent in one pass
+                old_temp = []
+                recent_temp = []
+                for f in temp_files:
+                    (old_temp if f['modified'] < week_ago else recent_temp).append(f)
                 
                 if old_temp:
-                    total_size = sum(f['size'] for f in old_temp)
+                    total_size = sum(map(get_size, old_temp))
                     suggestions.append({
                         'category': 'temp',
                         'description': 'Old temporary files (7+ days old)',
@@ -514,8 +1312,8 @@ class SmartFileScanner:
                         'safety': 'safe'
                     })
                     
-                if recent_temp and sum(f['size'] for f in recent_temp) > 100 * 1024 * 1024:  # >100MB
-                    total_size = sum(f['size'] for f in recent_temp)
+                total_size = sum(map(get_size, recent_temp))
+                if recent_temp and total_size > 100 * 1024 * 1024:  # >100MB
                     suggestions.append({
                         'category': 'temp',
                         'description': 'Recent temporary files (< 7 days)',
@@ -528,7 +1326,7 @@ class SmartFileScanner:
         if 'crashdumps' in file_data:
             crash_files = file_data['crashdumps']
             if crash_files:
-                total_size = sum(f['size'] for f in crash_files)
+                total_size = sum(map(get_size, crash_files))
                 suggestions.append({
                     'category': 'crashdumps',
                     'description': 'Crash dump files (debug information)',
@@ -540,9 +1338,9 @@ class SmartFileScanner:
         # Old installers
         if 'installers' in file_data:
             old_installers = [f for f in file_data['installers'] 
-                            if f['modified'] < datetime.now() - timedelta(days=30)]
+                            if f['modified'] < month_ago]
             if old_installers:
-                total_size = sum(f['size'] for f in old_installers)
+                total_size = sum(map(get_size, old_installers))
                 suggestions.append({
                     'category': 'installers',
                     'description': 'Old installer files (30+ days old)',
@@ -554,9 +1352,9 @@ class SmartFileScanner:
         # Old backup files
         if 'backups' in file_data:
             old_backups = [f for f in file_data['backups'] 
-                          if f['modified'] < datetime.now() - timedelta(days=30)]
+                          if f['modified'] < month_ago]
             if old_backups:
-                total_size = sum(f['size'] for f in old_backups)
+                total_size = sum(map(get_size, old_backups))
                 suggestions.append({
                     'category': 'backups',
                     'description': 'Old backup files (30+ days old)',
@@ -570,7 +1368,7 @@ class SmartFileScanner:
             large_media = [f for f in file_data['media'] 
                           if f['size'] > 1024 * 1024 * 1024]  # >1GB
             if large_media:
-                total_size = sum(f['size'] for f in large_media)
+                total_size = sum(map(get_size, large_media))
                 suggestions.append({
                     'category': 'media',
                     'description': 'Large media files (>1GB each)',
@@ -584,7 +1382,7 @@ class SmartFileScanner:
             large_downloads = [f for f in file_data['downloads'] 
                               if f['size'] > 500 * 1024 * 1024]  # 500MB+
             if large_downloads:
-                total_size = sum(f['size'] for f in large_downloads)
+                total_size = sum(map(get_size, large_downloads))
                 suggestions.append({
                     'category': 'downloads',
                     'description': 'Large files in Downloads folder',
@@ -598,12 +1396,17 @@ class SmartFileScanner:
         
         return suggestions
 
-def delete_large_files_interactive_enhanced(large_files, file_data):
-    """Enhanced interactive file deletion with safety checks"""
+def delete_large_files_interactive_enhanced(large_files, file_data, category_sizes=None):
+    """Enhanced interactive file deletion with safety checks. category_sizes
+    maps each category to its total size, if the caller tallied it while scanning."""
     if not large_files:
         return 0
+    
+    if category_sizes is None:
+        get_size = itemgetter('size')
+        category_sizes = {category: sum(map(get_size, files)) for category, files in file_data.items()}
         
-    config = ConfigManager()
+    config = get_config()
     safe_delete = SafeDeleteManager(config)
     
     print(f"\n{'='*60}")
@@ -612,20 +1415,15 @@ def delete_large_files_interactive_enhanced(large_files, file_data):
     
     # Show categorized summary
     print("\nFile Categories Found:")
-    for category, files in file_data.items():
-        if files:
-            total_size = sum(f['size'] for f in files)
-            print(f"  {category.title():12} {len(files):3} files  {get_size_readable(total_size):>10}")
+    print('\n'.join(f"  {category.title():12} {len(files):3} files  {get_size_readable(category_sizes[category]):>10}"
+                    for category, files in file_data.items() if files))
     
     # Show safety analysis
-    safety_counts = defaultdict(int)
-    for file_info in large_files:
-        safety_counts[file_info['safety']] += 1
+    safety_counts = Counter(map(itemgetter('safety'), large_files))
         
     print(f"\nSafety Analysis:")
-    for safety, count in safety_counts.items():
-        color = {'safe': '✓', 'user': '?', 'unknown': '!', 'critical': '✗'}.get(safety, '?')
-        print(f"  {color} {safety.title():12} {count:3} files")
+    print('\n'.join(f"  {SAFETY_ICONS.get(safety, '?')} {safety.title():12} {count:3} files"
+                    for safety, count in safety_counts.items()))
     
     # Get smart suggestions
     scanner = SmartFileScanner(config)
@@ -658,7 +1456,7 @@ def delete_large_files_interactive_enhanced(large_files, file_data):
         elif choice == '2':
             return _handle_manual_review(large_files, safe_delete)
         elif choice == '3':
-            return _handle_category_view(file_data, safe_delete)
+            return _handle_category_view(file_data, safe_delete, category_sizes)
         else:
             print("Deletion cancelled.")
             return 0
@@ -667,40 +1465,52 @@ def delete_large_files_interactive_enhanced(large_files, file_data):
         return _handle_manual_review(large_files, safe_delete)
 
 def _handle_smart_suggestions(suggestions, safe_delete):
-    """Handle smart suggestion-based cleanup"""
-    total_deleted = 0
+    """Handle smart suggestion-based cleanup: pick suggestions in one
+    prompt, then delete all their files in a single batch"""
+    chosen = _choose_suggestions(suggestions)
+    if not chosen:
+        print("Skipped.")
+        return 0
     
-    for i, suggestion in enumerate(suggestions, 1):
-        print(f"\n{'-'*50}")
-        print(f"Suggestion {i}: {suggestion['description']}")
-        print(f"Files: {len(suggestion['files'])} | Size: {get_size_readable(suggestion['total_size'])}")
-        print(f"Safety Level: {suggestion['safety']}")
-        
-        if suggestion['safety'] == 'safe':
-            default = 'Y'
-            prompt = f"Delete these files? (Y/n): "
-        else:
-            default = 'N'
-            prompt = f"Delete these files? (y/N): "
-            
-        response = input(prompt).strip().lower()
-        
-        if (response == 'y') or (response == '' and default == 'Y'):
-            print(f"Deleting {len(suggestion['files'])} files...")
-            
-            for file_info in suggestion['files']:
-                success, message = safe_delete.safe_delete(file_info['path'], file_info)
-                if success:
-                    total_deleted += file_info['size']
-                else:
-                    print(f"Failed: {os.path.basename(file_info['path'])} - {message}")
-                    
-            print(f"✓ Deleted {len(suggestion['files'])} files")
+    # Suggestions are per category, but a file is only deleted once
+    files = list({file_info['path']: file_info
+                  for i in chosen for file_info in suggestions[i - 1]['files']}.values())
+    print(f"Deleting {len(files)} files from {len(chosen)} suggestion(s)...")
+    
+    total_deleted = 0
+    deleted_count = 0
+    for file_info, success, message in safe_delete.delete_many(files):
+        if success:
+            total_deleted += file_info['size']
+            deleted_count += 1
         else:
-            print("Skipped.")
+            print(f"Failed: {os.path.basename(file_info['path'])} - {message}")
             
+    print(f"✓ Deleted {deleted_count} files")
     return total_deleted
 
+def _choose_suggestions(suggestions):
+    """Ask once which suggestions to apply; returns their 1-based numbers.
+    Pressing Enter takes every suggestion marked safe."""
+    safe_choice = [i for i, suggestion in enumerate(suggestions, 1) if suggestion['safety'] == 'safe']
+    default = ','.join(map(str, safe_choice)) or 'none'
+    
+    while True:
+        response = input(f"\nSuggestions to delete (e.g. 1,3; 'all' or 'none') [{default}]: ").strip().lower()
+        if not response:
+            return safe_choice
+        if response == 'none':
+            return []
+        if response == 'all':
+            return list(range(1, len(suggestions) + 1))
+        try:
+            chosen = sorted({int(part) for part in response.replace(' ', ',').split(',') if part})
+        except ValueError:
+            chosen = None
+        if chosen and all(1 <= i <= len(suggestions) for i in chosen):
+            return chosen
+        print(f"Please enter numbers from 1 to {len(suggestions)}, 'all' or 'none'")
+
 def _handle_manual_review(large_files, safe_delete):
     """Handle manual file-by-file review"""
     print(f"\nManual Review Mode")
@@ -732,8 +1542,7 @@ def _handle_manual_review(large_files, safe_delete):
             break
         elif response == 'a':
             # Delete all remaining files
-            for remaining_file in large_files[i-1:]:
-                success, message = safe_delete.safe_delete(remaining_file['path'], remaining_file)
+            for remaining_file, success, message in safe_delete.delete_many(large_files[i-1:]):
                 if success:
                     total_deleted += remaining_file['size']
             print(f"✓ Deleted all remaining files")
@@ -741,15 +1550,14 @@ def _handle_manual_review(large_files, safe_delete):
             
     return total_deleted
 
-def _handle_category_view(file_data, safe_delete):
+def _handle_category_view(file_data, safe_delete, category_sizes):
     """Handle category-based file viewing and deletion"""
     print(f"\nCategory View")
     
     categories = list(file_data.keys())
-    for i, category in enumerate(categories, 1):
-        files = file_data[category]
-        total_size = sum(f['size'] for f in files)
-        print(f"{i}. {category.title()} - {len(files)} files ({get_size_readable(total_size)})")
+    print('\n'.join(f"{i}. {category.title()} - {len(file_data[category])} files "
+                    f"({get_size_readable(category_sizes[category])})"
+                    for i, category in enumerate(categories, 1)))
         
     while True:
         choice = input(f"\nSelect category (1-{len(categories)}) or 'q' to quit: ").strip()
@@ -768,14 +1576,13 @@ def _review_category_files(files, safe_delete):
     """Review files in a specific category"""
     print(f"\nReviewing {len(files)} files:")
     
-    for i, file_info in enumerate(files, 1):
-        print(f"{i:3}. {get_size_readable(file_info['size']):>10} - {os.path.basename(file_info['path'])}")
+    print('\n'.join(f"{i:3}. {get_size_readable(file_info['size']):>10} - {os.path.basename(file_info['path'])}"
+                    for i, file_info in enumerate(files, 1)))
         
     response = input(f"\nDelete all files in this category? (y/N): ").lower().strip()
     if response == 'y':
         total_deleted = 0
-        for file_info in files:
-            success, message = safe_delete.safe_delete(file_info['path'], file_info)
+        for file_info, success, message in safe_delete.delete_many(files):
             if success:
                 total_deleted += file_info['size']
         return total_deleted
@@ -790,8 +1597,10 @@ def _show_file_info(file_info):
     print(f"Size: {get_size_readable(file_info['size'])}")
     print(f"Category: {file_info['category']}")
     print(f"Safety: {file_info['safety']}")
-    print(f"Modified: {file_info['modified'].strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"MIME Type: {file_info['mime_type']}")
+    print(f"Modified: {datetime.fromtimestamp(file_info['modified']).strftime('%Y-%m-%d %H:%M:%S')}")
+    # Files from known cache trees are not run through the analyzer
+    mime_type = file_info.get('mime_type') or mimetypes.guess_type(file_info['path'])[0] or 'unknown'
+    print(f"MIME Type: {mime_type}")
     print(f"{'-'*40}")
 
 # === Configuration Management ===
@@ -799,6 +1608,10 @@ class ConfigManager:
     def __init__(self, config_file="cScan_config.ini"):
         self.config_file = config_file
         self.config = configparser.ConfigParser()
+        # get_scan_paths result, rebuilt after any set()
+        self._scan_paths = None
+        # (conversion, section, key) -> converted value, cleared by set()
+        self._typed = {}
         self.load_config()
     
     def get_default_config(self):
@@ -816,7 +1629,8 @@ class ConfigManager:
                 'use_recycle_bin': 'true',
                 'show_safety_warnings': 'true',
                 'dry_run_mode': 'false',
-                'override_safety': 'false'
+                'override_safety': 'false',
+                'delete_workers': '4'  # files deleted/backed up/trashed at once
             },
             'Paths': {
                 'include_user_profile': 'true',
@@ -850,6 +1664,7 @@ class ConfigManager:
     
     def load_config(self):
         """Load configuration from file, create with defaults if doesn't exist"""
+        self._typed.clear()
         if os.path.exists(self.config_file):
             try:
                 self.config.read(self.config_file)
@@ -873,10 +1688,14 @@ class ConfigManager:
                 self.config.add_section(section)
                 config_updated = True
             
-            for key, default_value in keys.items():
-                if not self.config.has_option(section, key):
-                    self.config.set(section, key, default_value)
-                    config_updated = True
+            # Set differences against the options already present; missing
+            # keys are added in the defaults' order
+            missing = keys.keys() - self.config[section].keys()
+            if missing:
+                for key, default_value in keys.items():
+                    if key in missing:
+                        self.config.set(section, key, default_value)
+                config_updated = True
         
         if config_updated:
             self.save_config()
@@ -895,36 +1714,85 @@ class ConfigManager:
     
     def save_config(self):
         """Save current configuration to file"""
+        # Render first, then swap the finished file in, so a failed or
+        # interrupted save never leaves a half-written ini behind
+        buf = io.StringIO()
+        self.config.write(buf)
+        tmp_file = self.config_file + '.tmp'
         try:
-            with open(self.config_file, 'w') as f:
-                self.config.write(f)
+            with open(tmp_file, 'w') as f:
+                f.write(buf.getvalue())
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             print(f"Error saving config file: {e}")
     
     def get(self, section, key, fallback=None):
         """Get configuration value"""
-        return self.config.get(section, key, fallback=fallback)
+        return self._lookup(self.config.get, section, key, fallback)
     
     def getint(self, section, key, fallback=0):
         """Get integer configuration value"""
-        return self.config.getint(section, key, fallback=fallback)
+        return self._lookup(self.config.getint, section, key, fallback)
     
     def getboolean(self, section, key, fallback=False):
         """Get boolean configuration value"""
-        return self.config.getboolean(section, key, fallback=fallback)
+        return self._lookup(self.config.getboolean, section, key, fallback)
+    
+    def _lookup(self, convert, section, key, fallback):
+        """Read and convert an option once; later reads are a dict lookup.
+        Missing options return fallback and aren't cached, since callers
+        differ in the fallback they pass."""
+        cache_key = (convert.__name__, section, key)
+        try:
+            return self._typed[cache_key]
+        except KeyError:
+            pass
+        if not self.config.has_option(section, key):
+            return fallback
+        value = self._typed[cache_key] = convert(section, key)
+        return value
+    
+    def freeze(self):
+        """Snapshot every option as a typed attribute, e.g. cfg.max_files_to_display.
+        Types follow the defaults; later set() calls are not reflected. A value
+        that doesn't convert is replaced by its default, with a warning."""
+        values = {}
+        for section, keys in self.get_default_config().items():
+            for key, default in keys.items():
+                if default in ('true', 'false'):
+                    read, typed_default = self.getboolean, default == 'true'
+                elif default.isdigit():
+                    read, typed_default = self.getint, int(default)
+                else:
+                    read, typed_default = self.get, default
+                try:
+                    values[key] = read(section, key, typed_default)
+                except ValueError:
+                    print(f"Warning: Invalid value for [{section}] {key} = "
+                          f"{self.config.get(section, key)!r}; using default {default!r}")
+                    values[key] = typed_default
+        return SimpleNamespace(**values)
     
     def set(self, section, key, value):
         """Set configuration value"""
         if not self.config.has_section(section):
             self.config.add_section(section)
         self.config.set(section, key, str(value))
+        self._scan_paths = None
+        self._typed.clear()
     
     def get_scan_paths(self):
+        """Return the configured scan paths, building them on first use"""
+        if self._scan_paths is None:
+            self._scan_paths = self._build_scan_paths()
+        return list(self._scan_paths)
+    
+    def _build_scan_paths(self):
         """Build scan paths list based on configuration"""
         paths = []
         
         if IS_WINDOWS:
-            user_profile = os.environ.get("USERPROFILE", "")
+            user_profile = HOME_DIR
             
             if self.getboolean('Paths', 'include_user_profile'):
                 paths.append(user_profile)
@@ -962,8 +1830,8 @@ class ConfigManager:
                     os.path.join(user_profile, "AppData", "Local", "NuGet", "v3-cache"),  # NuGet cache
                     os.path.join(user_profile, ".gradle", "caches"),    # Gradle cache
                 ]
-                # Only add paths that exist
-                paths.extend([p for p in dev_cache_paths if os.path.exists(p)])
+                # Missing paths are dropped with the rest below
+                paths.extend(dev_cache_paths)
             
             # Browser cache directories (disabled by default for safety)
             if self.getboolean('Paths', 'include_browser_caches', False):
@@ -980,14 +1848,8 @@ class ConfigManager:
                     os.path.join(user_profile, "AppData", "Local", "Microsoft", "Edge", "User Data", "Default", "Code Cache"),
                 ]
                 # Handle wildcard paths for Firefox
-                import glob
-                expanded_paths = []
                 for path in browser_cache_paths:
-                    if '*' in path:
-                        expanded_paths.extend(glob.glob(path))
-                    elif os.path.exists(path):
-                        expanded_paths.append(path)
-                paths.extend(expanded_paths)
+                    paths.extend(_expand_wildcard(path) if '*' in path else [path])
             
             # Application cache directories (disabled by default for safety)  
             if self.getboolean('Paths', 'include_app_caches', False):
@@ -1007,11 +1869,11 @@ class ConfigManager:
                     # Spotify cache
                     os.path.join(user_profile, "AppData", "Local", "Spotify", "Data"),
                 ]
-                # Only add paths that exist
-                paths.extend([p for p in app_cache_paths if os.path.exists(p)])
+                # Missing paths are dropped with the rest below
+                paths.extend(app_cache_paths)
         else:
             # macOS/Linux
-            home = os.path.expanduser("~")
+            home = HOME_DIR
             
             if self.getboolean('Paths', 'include_user_profile'):
                 paths.append(home)
@@ -1065,8 +1927,8 @@ class ConfigManager:
                         os.path.join(home, "Library", "Caches", "pip"),  # macOS pip cache
                         os.path.join(home, "Library", "Caches", "Homebrew"),  # Homebrew cache
                     ])
-                # Only add paths that exist
-                paths.extend([p for p in dev_cache_paths if os.path.exists(p)])
+                # Missing paths are dropped with the rest below
+                paths.extend(dev_cache_paths)
             
             # Browser cache directories (disabled by default for safety)
             if self.getboolean('Paths', 'include_browser_caches', False):
@@ -1088,15 +1950,9 @@ class ConfigManager:
                         os.path.join(home, ".cache", "mozilla", "firefox", "*", "cache2"),
                     ]
                 
-                # Handle wildcard paths and existing paths
-                import glob
-                expanded_paths = []
+                # Handle wildcard paths; missing paths are dropped below
                 for path in browser_cache_paths:
-                    if '*' in path:
-                        expanded_paths.extend(glob.glob(path))
-                    elif os.path.exists(path):
-                        expanded_paths.append(path)
-                paths.extend(expanded_paths)
+                    paths.extend(_expand_wildcard(path) if '*' in path else [path])
             
             # Application cache directories (disabled by default for safety)
             if self.getboolean('Paths', 'include_app_caches', False):
@@ -1119,8 +1975,8 @@ class ConfigManager:
                         # Slack cache
                         os.path.join(home, ".config", "Slack", "Cache"),
                     ]
-                # Only add paths that exist
-                paths.extend([p for p in app_cache_paths if os.path.exists(p)])
+                # Missing paths are dropped with the rest below
+                paths.extend(app_cache_paths)
         
         # Add custom paths
         custom_paths = self.get('Paths', 'custom_scan_paths', '')
@@ -1130,8 +1986,9 @@ class ConfigManager:
                 if path:
                     paths.append(path)
         
-        # Remove duplicates and non-existent paths
-        return list(set([p for p in paths if p and os.path.exists(p)]))
+        # Remove duplicates, non-existent paths and paths already inside
+        # another scan path, keeping the configured order
+        return tuple(_collapse_nested(_existing_paths(p for p in paths if p)))
     
     def show_config_editor(self):
         """Show a simple config editor dialog"""
@@ -1143,6 +2000,7 @@ class ConfigManager:
     
     def _show_config_gui(self):
         """GUI configuration editor"""
+        _import_tk()
         config_window = tk.Toplevel()
         config_window.title("Configuration Settings")
         config_window.geometry("600x500")
@@ -1228,6 +2086,7 @@ class ConfigManager:
             self.set('Paths', 'custom_scan_paths', custom_paths_var.get())
             
             self.save_config()
+            get_config.cache_clear()
             messagebox.showinfo("Success", "Configuration saved successfully!")
             config_window.destroy()
         
@@ -1244,35 +2103,63 @@ class ConfigManager:
         print("5. Use Recycle Bin for deletion:", self.getboolean('Settings', 'use_recycle_bin'))
         print("\nTo modify, edit the file:", self.config_file)
 
+@lru_cache(maxsize=1)
+def get_config():
+    """Return the shared ConfigManager, loading the config file on first use"""
+    return ConfigManager()
+
 # Initialize global config
-config = ConfigManager()
+config = get_config()
 
 # === Simple Progress Bar Class ===
 class ProgressBar:
+    """Console progress bar. With total=None the amount of work isn't known
+    up front, and a running count is shown instead of a bar."""
+    # Seconds between redraws; the bar is also redrawn whenever the whole
+    # percentage changes
+    REFRESH_INTERVAL = 0.05
+    
     def __init__(self, total, width=50, desc="Progress"):
         self.total = total
         self.width = width
         self.desc = desc
         self.current = 0
         self.start_time = time.time()
+        self._bars = ['█' * filled + '░' * (width - filled) for filled in range(width + 1)]
+        self._last_emit = 0.0
+        self._last_pct_int = -1
+    
+    def _ratio(self):
+        return self.current / self.total if self.total else 0.0
     
     def update(self, count=1):
         self.current += count
-        percent = (self.current / self.total) * 100 if self.total > 0 else 0
-        filled = int(self.width * self.current / self.total) if self.total > 0 else 0
-        bar = '█' * filled + '░' * (self.width - filled)
+        ratio = self._ratio()
+        now = time.time()
+        if int(ratio * 100) == self._last_pct_int and now - self._last_emit < self.REFRESH_INTERVAL:
+            return
+        self._draw(ratio, now)
+    
+    def _draw(self, ratio, now):
+        self._last_emit = now
+        self._last_pct_int = int(ratio * 100)
+        if self.total is None:
+            sys.stdout.write(f"\r{self.desc}: {self.current:,} done ({int(now - self.start_time)}s)")
+            sys.stdout.flush()
+            return
+        bar = self._bars[max(0, min(int(self.width * ratio), self.width))]
         
-        elapsed = time.time() - self.start_time
         if self.current > 0:
-            eta = (elapsed / self.current) * (self.total - self.current)
+            eta = ((now - self.start_time) / self.current) * (self.total - self.current)
             eta_str = f"ETA: {int(eta)}s" if eta > 0 else "Done"
         else:
             eta_str = "ETA: --"
         
-        print(f"\r{self.desc}: [{bar}] {percent:.1f}% ({self.current}/{self.total}) {eta_str}", end='', flush=True)
+        sys.stdout.write(f"\r{self.desc}: [{bar}] {ratio * 100:.1f}% ({self.current}/{self.total}) {eta_str}")
+        sys.stdout.flush()
     
     def finish(self):
-        self.update(0)  # Update display
+        self._draw(self._ratio(), time.time())  # Always show the final state
         print()  # New line
 
 # === Configuration ===
@@ -1284,8 +2171,9 @@ CLEAN_RECYCLE_BIN = config.getboolean('Settings', 'clean_recycle_by_default', Tr
 SCAN_PATHS = config.get_scan_paths()
 
 # === Check if running as admin ===
+@lru_cache(maxsize=1)
 def is_admin():
-    """Check if running with admin/root privileges"""
+    """Check if running with admin/root privileges (checked once per run)"""
     if IS_WINDOWS:
         try:
             return ctypes.windll.shell32.IsUserAnAdmin()
@@ -1296,31 +2184,39 @@ def is_admin():
         return os.geteuid() == 0
 
 # === Function to convert bytes to readable format ===
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def get_size_readable(num):
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if num < 1024:
-            return f"{num:.2f} {unit}"
-        num /= 1024
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit
+    unit = min((int(num).bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if num >= 1024 else 0
+    return f"{num / (1 << (unit * 10)):.2f} {SIZE_UNITS[unit]}"
 
 # === Step 1: Find Large Files ===
 def find_large_files(scan_paths, min_size_mb):
     """Find files larger than specified size in MB - Enhanced version"""
-    config = ConfigManager()
+    config = get_config()
     scanner = SmartFileScanner(config)
     
     print(f"Scanning for large files (>{min_size_mb}MB) with enhanced analysis...")
     
-    # Use the enhanced scanner
-    large_files_info, file_data = scanner.scan_files(scan_paths, min_size_mb)
+    # Only (path, size) is kept per file, in the original format for
+    # compatibility; full file info is kept just for the ten largest
+    large_files = []
     
-    if large_files_info:
-        # Convert to original format for compatibility
-        large_files = [(info['path'], info['size']) for info in large_files_info]
-        
+    def record(infos):
+        for info in infos:
+            large_files.append((info['path'], info['size']))
+            yield info
+    
+    largest = heapq.nlargest(10, record(scanner.iter_large_files(scan_paths, min_size_mb)),
+                             key=itemgetter('size'))
+    
+    if large_files:
         print(f"\nFound {len(large_files)} large files:")
-        for info in sorted(large_files_info, key=lambda x: -x['size'])[:10]:
-            safety_icon = {'safe': '✓', 'user': '?', 'unknown': '!', 'critical': '✗'}.get(info['safety'], '?')
-            print(f"  {get_size_readable(info['size']):>10} {safety_icon} [{info['category']}] - {info['path']}")
+        rows = [f"  {get_size_readable(info['size']):>10} {SAFETY_ICONS.get(info['safety'], '?')} "
+                f"[{info['category']}] - {info['path']}"
+                for info in largest]
+        print('\n'.join(rows))
         
         if len(large_files) > 10:
             print(f"  ... and {len(large_files) - 10} more files")
@@ -1395,17 +2291,22 @@ def delete_large_files_interactive(large_files):
         print(f"\nDeleting {len(files_to_delete)} files...")
         progress = ProgressBar(len(files_to_delete), desc="Deleting files")
         
-        deleted_count = 0
-        for filepath, size in files_to_delete:
-            progress.update(1)
-            try:
-                os.remove(filepath)
-                total_deleted_size += size
-                deleted_count += 1
-            except (OSError, PermissionError) as e:
-                print(f"\nFailed to delete: {filepath} - {e}")
-            except Exception as e:
-                print(f"\nError deleting: {filepath} - {e}")
+        deleted = [0, 0]  # count, bytes
+        lock = threading.Lock()
+        
+        def on_result(filepath, size, error):
+            with lock:
+                progress.update(1)
+                if error is None:
+                    deleted[0] += 1
+                    deleted[1] += size
+                elif isinstance(error, (OSError, PermissionError)):
+                    print(f"\nFailed to delete: {filepath} - {error}")
+                else:
+                    print(f"\nError deleting: {filepath} - {error}")
+        
+        _remove_files(files_to_delete, on_result)
+        deleted_count, total_deleted_size = deleted
         
         progress.finish()
         print(f"Successfully deleted {deleted_count} files, freed {get_size_readable(total_deleted_size)}")
@@ -1421,7 +2322,7 @@ def clear_temp_dirs():
     temp_dirs = []
     
     if IS_WINDOWS:
-        user_profile = os.environ.get("USERPROFILE", "")
+        user_profile = HOME_DIR
         temp_dirs = [
             tempfile.gettempdir(),  # Usually user temp
             os.environ.get("TEMP", ""),
@@ -1430,7 +2331,7 @@ def clear_temp_dirs():
         ]
     else:
         # macOS/Linux
-        home = os.path.expanduser("~")
+        home = HOME_DIR
         temp_dirs = [
             tempfile.gettempdir(),
             "/tmp",
@@ -1451,65 +2352,17 @@ def clear_temp_dirs():
         print("No accessible temp directories found.")
         return 0
     
-    # Count total files first
-    print("Counting temp files...")
-    total_files = 0
-    for temp_dir in temp_dirs:
-        try:
-            for root, dirs, files in os.walk(temp_dir):
-                # Skip system directories on macOS/Linux
-                if not IS_WINDOWS and ('/private/var' in root or '/System' in root):
-                    continue
-                total_files += len(files)
-        except (OSError, PermissionError):
-            continue
-    
-    if total_files == 0:
-        print("No temp files found.")
-        return 0
-    
-    print(f"Cleaning {total_files:,} temp files...")
-    progress = ProgressBar(total_files, desc="Cleaning temp files")
+    # The temp dirs are walked once, by the cleanup itself, so the number
+    # of files isn't known up front; progress is a running count
+    print("Cleaning temp files...")
+    progress = ProgressBar(None, desc="Cleaning temp files")
     
     total_freed = 0
     for temp_dir in temp_dirs:
         print(f"\nCleaning: {temp_dir}")
-        dir_freed = 0
         
         try:
-            for root, dirs, files in os.walk(temp_dir, topdown=False):
-                # Skip system directories on macOS/Linux
-                if not IS_WINDOWS and ('/private/var' in root or '/System' in root):
-                    continue
-                    
-                for name in files:
-                    progress.update(1)
-                    try:
-                        file_path = os.path.join(root, name)
-                        # Skip files that might be in use
-                        if not IS_WINDOWS:
-                            # On Unix systems, check if we own the file
-                            stat = os.stat(file_path)
-                            if stat.st_uid != os.getuid():
-                                continue
-                        
-                        file_size = os.path.getsize(file_path)
-                        os.remove(file_path)
-                        dir_freed += file_size
-                    except (OSError, PermissionError):
-                        continue
-                        
-                for name in dirs:
-                    try:
-                        dir_path = os.path.join(root, name)
-                        # Only remove directories we own
-                        if not IS_WINDOWS:
-                            stat = os.stat(dir_path)
-                            if stat.st_uid != os.getuid():
-                                continue
-                        shutil.rmtree(dir_path, ignore_errors=True)
-                    except (OSError, PermissionError):
-                        continue
+            dir_freed = _purge_dir(temp_dir, progress)
         except (OSError, PermissionError):
             continue
         
@@ -1518,38 +2371,132 @@ def clear_temp_dirs():
             total_freed += dir_freed
     
     progress.finish()
+    if progress.current == 0:
+        print("No temp files found.")
     return total_freed
 
 # === Step 3: Empty Recycle Bin/Trash ===
-def empty_recycle_bin():
-    """Empty Recycle Bin/Trash on all platforms"""
+def _dir_usage(path):
+    """Return (entries directly in path, total bytes of all files below it).
+    Entry types come from the directory listings, so only regular files
+    are stat'ed."""
+    with os.scandir(path) as it:
+        items = list(it)
+    total_size = 0
+    for entry in items:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                total_size += sum(size for _, size in _iter_files(entry.path))
+            elif entry.is_file(follow_symlinks=False):
+                total_size += entry.stat(follow_symlinks=False).st_size
+        except (OSError, PermissionError):
+            continue
+    return len(items), total_size
+
+if IS_WINDOWS:
+    class _SHQUERYRBINFO(ctypes.Structure):
+        # shellapi.h packs this structure to 1 byte on 32-bit Windows
+        if ctypes.sizeof(ctypes.c_void_p) == 4:
+            _pack_ = 1
+        _fields_ = [('cbSize', ctypes.c_ulong),
+                    ('i64Size', ctypes.c_longlong),
+                    ('i64NumItems', ctypes.c_longlong)]
+    
+    class _SHFILEOPSTRUCTW(ctypes.Structure):
+        # Packed like _SHQUERYRBINFO on 32-bit Windows
+        if ctypes.sizeof(ctypes.c_void_p) == 4:
+            _pack_ = 1
+        _fields_ = [('hwnd', ctypes.c_void_p),
+                    ('wFunc', ctypes.c_uint),
+                    ('pFrom', ctypes.c_wchar_p),
+                    ('pTo', ctypes.c_wchar_p),
+                    ('fFlags', ctypes.c_ushort),
+                    ('fAnyOperationsAborted', ctypes.c_int),
+                    ('hNameMappings', ctypes.c_void_p),
+                    ('lpszProgressTitle', ctypes.c_wchar_p)]
+
+# SHEmptyRecycleBinW flags: no confirmation dialog, no progress UI, no sound
+SHERB_SILENT = 0x1 | 0x2 | 0x4
+
+# SHFileOperationW: delete to the Recycle Bin without any dialogs
+FO_DELETE = 0x3
+FOF_RECYCLE_SILENT = 0x4 | 0x10 | 0x40 | 0x400  # SILENT | NOCONFIRMATION | ALLOWUNDO | NOERRORUI
+
+def _recycle_native(paths):
+    """Move files to the Recycle Bin with one in-process SHFileOperationW
+    call; returns True if every file was moved"""
+    op = _SHFILEOPSTRUCTW()
+    op.wFunc = FO_DELETE
+    # A double-NUL-terminated list of full paths; ctypes adds the final NUL
+    op.pFrom = '\0'.join(os.path.abspath(p) for p in paths) + '\0'
+    op.fFlags = FOF_RECYCLE_SILENT
+    try:
+        result = ctypes.windll.shell32.SHFileOperationW(ctypes.byref(op))
+    except (AttributeError, OSError):
+        return False
+    return result == 0 and not op.fAnyOperationsAborted
+
+def _query_recycle_bin():
+    """Return (item_count, total_bytes) for the Recycle Bins of all drives,
+    or None if the shell query fails"""
+    try:
+        info = _SHQUERYRBINFO()
+        info.cbSize = ctypes.sizeof(info)
+        if ctypes.windll.shell32.SHQueryRecycleBinW(None, ctypes.byref(info)) != 0:
+            return None
+    except (AttributeError, OSError):
+        return None
+    return info.i64NumItems, info.i64Size
+
+def _empty_recycle_bin_native():
+    """Empty the Recycle Bins of all drives in-process; returns True on success"""
+    try:
+        return ctypes.windll.shell32.SHEmptyRecycleBinW(None, None, SHERB_SILENT) == 0
+    except (AttributeError, OSError):
+        return False
+
+def empty_recycle_bin(ask=input):
+    """Empty Recycle Bin/Trash on all platforms. ask(prompt) answers the
+    y/N confirmations; the GUI confirms in a dialog first and answers 'y'"""
     if IS_WINDOWS:
         print("\nChecking Recycle Bin...")
         try:
-            # First try to check if recycle bin has items
-            result = subprocess.run([
-                "powershell.exe", "-Command", 
-                "(Get-ChildItem -Path '$env:USERPROFILE\\$Recycle.Bin' -Force -Recurse -ErrorAction SilentlyContinue | Measure-Object).Count"
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0 and result.stdout.strip().isdigit():
-                count = int(result.stdout.strip())
+            # Ask the shell for the item count and size of all drives' bins;
+            # fall back to counting through PowerShell if that fails
+            status = _query_recycle_bin()
+            if status is None:
+                result = subprocess.run([
+                    "powershell.exe", "-Command", 
+                    "(Get-ChildItem -Path '$env:USERPROFILE\\$Recycle.Bin' -Force -Recurse -ErrorAction SilentlyContinue | Measure-Object).Count"
+                ], capture_output=True, text=True)
+                if result.returncode == 0 and result.stdout.strip().isdigit():
+                    status = (int(result.stdout.strip()), 0)
+            
+            if status is not None:
+                count, total_size = status
                 
                 if count == 0:
                     print("Recycle Bin appears to be empty.")
                     return 0
                 else:
-                    print(f"Found items in Recycle Bin.")
+                    if total_size:
+                        print(f"Found {count} items in Recycle Bin ({get_size_readable(total_size)})")
+                    else:
+                        print(f"Found items in Recycle Bin.")
                     
                     # Ask for confirmation
-                    response = input("Empty Recycle Bin? (y/N): ").lower()
+                    response = ask("Empty Recycle Bin? (y/N): ").lower()
                     if response == 'y':
-                        # Try the standard Clear-RecycleBin command first
+                        if _empty_recycle_bin_native():
+                            print("Recycle Bin emptied.")
+                            return total_size
+                        
+                        # Try the standard Clear-RecycleBin command next
                         try:
                             subprocess.run(["powershell.exe", "-Command", "Clear-RecycleBin -Force"], 
                                          check=True, capture_output=True)
                             print("Recycle Bin emptied.")
-                            return 0
+                            return total_size
                         except subprocess.CalledProcessError:
                             # Fallback: try alternative method
                             try:
@@ -1558,7 +2505,7 @@ def empty_recycle_bin():
                                     "Get-ChildItem -Path '$env:USERPROFILE\\$Recycle.Bin' -Force -Recurse | Remove-Item -Recurse -Force"
                                 ], check=True, capture_output=True)
                                 print("Recycle Bin emptied (using alternative method).")
-                                return 0
+                                return total_size
                             except subprocess.CalledProcessError as e:
                                 print(f"Failed to empty Recycle Bin: {e}")
                                 print("You can manually empty it from the desktop Recycle Bin icon.")
@@ -1568,8 +2515,11 @@ def empty_recycle_bin():
                         return 0
             else:
                 # Can't check status, just ask if they want to try
-                response = input("Unable to check Recycle Bin status. Try to empty it? (y/N): ").lower()
+                response = ask("Unable to check Recycle Bin status. Try to empty it? (y/N): ").lower()
                 if response == 'y':
+                    if _empty_recycle_bin_native():
+                        print("Recycle Bin empty command executed.")
+                        return 0
                     try:
                         subprocess.run(["powershell.exe", "-Command", "Clear-RecycleBin -Force"], 
                                      check=True, capture_output=True)
@@ -1586,33 +2536,19 @@ def empty_recycle_bin():
         print("\nChecking Trash...")
         try:
             # Check trash size
-            home = os.path.expanduser("~")
+            home = HOME_DIR
             trash_path = os.path.join(home, ".Trash")
             
             if os.path.exists(trash_path):
-                # Count items in trash
-                items = os.listdir(trash_path)
-                if not items:
+                # Count items in trash and their size
+                item_count, total_size = _dir_usage(trash_path)
+                if not item_count:
                     print("Trash appears to be empty.")
                     return 0
-                    
-                # Calculate size
-                total_size = 0
-                for item in items:
-                    item_path = os.path.join(trash_path, item)
-                    try:
-                        if os.path.isfile(item_path):
-                            total_size += os.path.getsize(item_path)
-                        elif os.path.isdir(item_path):
-                            for root, dirs, files in os.walk(item_path):
-                                for f in files:
-                                    total_size += os.path.getsize(os.path.join(root, f))
-                    except (OSError, PermissionError):
-                        continue
                         
-                print(f"Found {len(items)} items in Trash ({get_size_readable(total_size)})")
+                print(f"Found {item_count} items in Trash ({get_size_readable(total_size)})")
                 
-                response = input("Empty Trash? (y/N): ").lower()
+                response = ask("Empty Trash? (y/N): ").lower()
                 if response == 'y':
                     try:
                         # Use osascript to empty trash
@@ -1623,10 +2559,9 @@ def empty_recycle_bin():
                         print("Trash emptied.")
                         return total_size
                     except subprocess.CalledProcessError:
-                        # Fallback: manual deletion
+                        # Fallback: manual deletion, keeping the Trash folder itself
                         try:
-                            shutil.rmtree(trash_path)
-                            os.makedirs(trash_path)  # Recreate empty trash
+                            _purge_dir(trash_path)
                             print("Trash emptied (manual method).")
                             return total_size
                         except Exception as e:
@@ -1647,7 +2582,7 @@ def empty_recycle_bin():
         # Linux
         print("\nChecking Trash...")
         try:
-            home = os.path.expanduser("~")
+            home = HOME_DIR
             trash_dirs = [
                 os.path.join(home, ".local/share/Trash/files"),
                 os.path.join(home, ".local/share/Trash/info"),
@@ -1657,25 +2592,20 @@ def empty_recycle_bin():
             total_items = 0
             
             for trash_dir in trash_dirs:
-                if os.path.exists(trash_dir):
-                    items = os.listdir(trash_dir)
-                    total_items += len(items)
-                    
-                    for item in items:
-                        item_path = os.path.join(trash_dir, item)
-                        try:
-                            if os.path.isfile(item_path):
-                                total_size += os.path.getsize(item_path)
-                        except (OSError, PermissionError):
-                            continue
+                try:
+                    item_count, dir_size = _dir_usage(trash_dir)
+                except (OSError, PermissionError):
+                    continue
+                total_items += item_count
+                total_size += dir_size
                             
             if total_items == 0:
                 print("Trash appears to be empty.")
                 return 0
                 
-            print(f"Found {total_items} items in Trash")
+            print(f"Found {total_items} items in Trash ({get_size_readable(total_size)})")
             
-            response = input("Empty Trash? (y/N): ").lower()
+            response = ask("Empty Trash? (y/N): ").lower()
             if response == 'y':
                 try:
                     # Try using gio trash --empty
@@ -1683,11 +2613,13 @@ def empty_recycle_bin():
                     print("Trash emptied.")
                     return total_size
                 except (subprocess.CalledProcessError, FileNotFoundError):
-                    # Fallback: manual deletion
+                    # Fallback: manual deletion, keeping the Trash folders themselves
                     for trash_dir in trash_dirs:
                         if os.path.exists(trash_dir):
-                            shutil.rmtree(trash_dir, ignore_errors=True)
-                            os.makedirs(trash_dir)
+                            try:
+                                _purge_dir(trash_dir)
+                            except (OSError, PermissionError):
+                                continue
                     print("Trash emptied (manual method).")
                     return total_size
             else:
@@ -1699,8 +2631,29 @@ def empty_recycle_bin():
             return 0
 
 # === GUI Class ===
+# tkinter is only imported once a window is opened; CLI runs never load it
+tk = ttk = messagebox = scrolledtext = None
+
+def _import_tk():
+    """Import tkinter into the module globals used by the GUI code"""
+    global tk, ttk, messagebox, scrolledtext
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as _ttk, messagebox as _messagebox, scrolledtext as _scrolledtext
+        ttk, messagebox, scrolledtext = _ttk, _messagebox, _scrolledtext
+        tk = tkinter
+# Queued widget updates are applied every UI_PUMP_INTERVAL_MS, at most UI_PUMP_BATCH per tick
+UI_PUMP_INTERVAL_MS = 50
+UI_PUMP_BATCH = 200
+# Queued widget updates held at most; background threads posting more wait
+# for the pump to catch up
+UI_QUEUE_MAX = 1024
+# Scan progress updates posted per second
+SCAN_PROGRESS_HZ = 20
+
 class CleanupGUI:
     def __init__(self):
+        _import_tk()
         self.root = tk.Tk()
         self.root.title("cScan - Storage Cleanup Assistant")
         self.root.geometry("1000x750")
@@ -1727,7 +2680,21 @@ class CleanupGUI:
         self.large_files = []
         self.total_freed = 0
         
+        # Widget updates from background threads are queued here and applied
+        # in batches on the Tk thread by _pump_ui. The Tk thread can't wait on
+        # its own full queue, so its updates go to _ui_pending instead.
+        self._ui_queue = queue.Queue(maxsize=UI_QUEUE_MAX)
+        self._ui_pending = []
+        self._tk_thread = threading.get_ident()
+        
+        # Background work runs one job at a time on a single long-lived
+        # worker thread; _cancel asks a scan to stop early
+        self._jobs = queue.Queue()
+        self._cancel = threading.Event()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        
         self.create_widgets()
+        self.root.after(UI_PUMP_INTERVAL_MS, self._pump_ui)
     
     def setup_styles(self):
         """Configure modern ttk styles"""
@@ -1827,6 +2794,13 @@ class CleanupGUI:
         )
         self.output_text.pack(fill=tk.BOTH, expand=True)
         
+        # Configure text tags for different message types
+        self.output_text.tag_configure("info", foreground=self.colors['text'])
+        self.output_text.tag_configure("success", foreground=self.colors['success'], font=('Consolas', 9, 'bold'))
+        self.output_text.tag_configure("warning", foreground=self.colors['warning'], font=('Consolas', 9, 'bold'))
+        self.output_text.tag_configure("error", foreground=self.colors['danger'], font=('Consolas', 9, 'bold'))
+        self.output_text.tag_configure("header", foreground=self.colors['primary'], font=('Consolas', 10, 'bold'))
+        
         # Modern button section
         action_frame = ttk.LabelFrame(main_frame, text="Actions", padding=15)
         action_frame.pack(fill=tk.X)
@@ -1839,6 +2813,10 @@ class CleanupGUI:
                                   style='Primary.TButton', command=self.start_scan)
         self.scan_btn.pack(side=tk.LEFT, padx=(0, 15))
         
+        self.cancel_btn = ttk.Button(primary_row, text="⏹️ Cancel",
+                                    style='Modern.TButton', command=self.cancel_job, state='disabled')
+        self.cancel_btn.pack(side=tk.LEFT, padx=(0, 15))
+        
         # Cleanup actions row
         cleanup_row = ttk.Frame(action_frame)
         cleanup_row.pack(fill=tk.X, pady=(0, 10))
@@ -1876,43 +2854,113 @@ class CleanupGUI:
         """Add message to both GUI and terminal with color coding"""
         print(message)  # Print to terminal
         
-        # Configure text tags for different message types
-        if not hasattr(self, '_tags_configured'):
-            self.output_text.tag_configure("info", foreground=self.colors['text'])
-            self.output_text.tag_configure("success", foreground=self.colors['success'], font=('Consolas', 9, 'bold'))
-            self.output_text.tag_configure("warning", foreground=self.colors['warning'], font=('Consolas', 9, 'bold'))
-            self.output_text.tag_configure("error", foreground=self.colors['danger'], font=('Consolas', 9, 'bold'))
-            self.output_text.tag_configure("header", foreground=self.colors['primary'], font=('Consolas', 10, 'bold'))
-            self._tags_configured = True
-        
         # Add timestamp for better tracking
-        from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
-        formatted_message = f"[{timestamp}] {message}\n"
-        
-        # Insert with appropriate styling
-        self.output_text.insert(tk.END, formatted_message, level)
-        self.output_text.see(tk.END)
-        self.root.update_idletasks()
+        self._post('log', (f"[{timestamp}] {message}\n", level))
         
     def update_status(self, status):
         """Update status label with modern styling"""
-        self.status_label.config(text=f"📊 {status}")
+        self._post('status', f"📊 {status}")
         self.log_output(f"Status: {status}", "info")
+    
+    def _post(self, kind, payload):
+        """Queue a widget update for _pump_ui, from any thread"""
+        if threading.get_ident() == self._tk_thread:
+            self._ui_pending.append((kind, payload))
+        else:
+            self._ui_queue.put((kind, payload))
+    
+    def set_progress(self, **options):
+        """Queue a progress bar update (maximum/value)"""
+        self._post('progress', options)
+    
+    def set_progress_busy(self, busy):
+        """Queue switching the progress bar to an animated indeterminate bar,
+        for work of unknown size, or back to an empty determinate one"""
+        def apply():
+            if busy:
+                self.progress.config(mode='indeterminate')
+                self.progress.start()
+            else:
+                self.progress.stop()
+                self.progress.config(mode='determinate', value=0)
+        self._post('call', apply)
+    
+    def _pump_ui(self):
+        """Apply queued widget updates on the Tk thread, one redraw per batch"""
+        chunks = []
+        status = None
+        progress = {}
+        calls = []
+        
+        pending, self._ui_pending = self._ui_pending, []
+        for _ in range(UI_PUMP_BATCH):
+            if pending:
+                kind, payload = pending.pop(0)
+            else:
+                try:
+                    kind, payload = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+            if kind == 'log':
+                chunks.extend(payload)
+            elif kind == 'status':
+                status = payload
+            elif kind == 'progress':
+                progress.update(payload)
+            elif kind == 'call':
+                calls.append(payload)
+        # Keep any Tk-thread updates beyond this batch for the next tick
+        self._ui_pending[:0] = pending
         
+        try:
+            if chunks:
+                # Text.insert takes alternating text/tag arguments
+                self.output_text.insert(tk.END, *chunks)
+                self.output_text.see(tk.END)
+            if status is not None:
+                self.status_label.config(text=status)
+            if progress:
+                self.progress.config(**progress)
+            for call in calls:
+                call()
+        finally:
+            self.root.after(UI_PUMP_INTERVAL_MS, self._pump_ui)
+        
+    def _worker_loop(self):
+        """Run queued background jobs in order (runs in the worker thread)"""
+        while True:
+            func, args = self._jobs.get()
+            try:
+                func(*args)
+            except Exception as e:
+                self.log_output(f"❌ Background task failed: {e}", "error")
+    
+    def submit_job(self, func, *args):
+        """Queue func(*args) for the background worker thread"""
+        self._jobs.put((func, args))
+    
+    def cancel_job(self):
+        """Ask the running background job to stop"""
+        self._cancel.set()
+        self.cancel_btn.config(state='disabled')
+        self.update_status("Cancelling...")
+    
     def start_scan(self):
         """Start the file scanning process"""
         self.scan_btn.config(state='disabled')
         self.clean_temp_btn.config(state='disabled')
         self.empty_recycle_btn.config(state='disabled')
         
+        self.cancel_btn.config(state='normal')
+        
         # Clear previous output
         self.output_text.delete(1.0, tk.END)
         
-        # Start scan in separate thread
-        thread = threading.Thread(target=self.scan_files)
-        thread.daemon = True
-        thread.start()
+        # Scan on the worker thread. _cancel is reset on submission, so a
+        # Cancel clicked while the scan is still queued isn't lost
+        self._cancel.clear()
+        self.submit_job(self.scan_files)
         
     def scan_files(self):
         """Scan for large files (runs in separate thread)"""
@@ -1920,9 +2968,7 @@ class CleanupGUI:
             self.update_status("Scanning for large files...")
             
             # Get configuration
-            global config
-            if not config:
-                config = ConfigManager()
+            config = get_config()
             
             # Get scan paths from config
             scan_paths = config.get_scan_paths()
@@ -1936,84 +2982,67 @@ class CleanupGUI:
             
             # Find large files with progress updates
             self.large_files = self.find_large_files_gui(scan_paths, large_file_size_mb)
+            if self._cancel.is_set():
+                self.log_output("\n⏹️ Scan cancelled; showing files found so far.", "warning")
             
             if self.large_files:
                 self.log_output(f"\n🎯 Found {len(self.large_files)} large files:", "header")
-                for path, size in sorted(self.large_files, key=lambda x: -x[1])[:50]:
+                for path, size in heapq.nlargest(50, self.large_files, key=itemgetter(1)):
                     self.log_output(f"  {get_size_readable(size):>10} - {path}")
                 
                 total_large = sum(size for _, size in self.large_files)
                 self.log_output(f"\n📏 Total size of large files: {get_size_readable(total_large)}", "success")
                 
                 # Create file selection window
-                self.root.after(0, self.show_file_selection)
+                self._post('call', self.show_file_selection)
             else:
                 self.log_output("✅ No large files found.", "success")
-                self.root.after(0, self.enable_cleanup_buttons)
+                self._post('call', self.enable_cleanup_buttons)
                 
         except Exception as e:
             self.log_output(f"❌ Error during scan: {e}", "error")
-            self.root.after(0, self.enable_scan_button)
+            self._post('call', self.enable_scan_button)
+        finally:
+            self._post('call', lambda: self.cancel_btn.config(state='disabled'))
     
     def find_large_files_gui(self, scan_paths, min_size_mb):
         """Find large files with GUI progress updates"""
-        large_files = []
-        skipped_dirs = []
-        seen_files = set()
-        
-        # Count total files
-        self.root.after(0, lambda: self.update_status("Counting files..."))
-        total_files = 0
-        valid_paths = []
-        
-        for base_path in scan_paths:
-            if not base_path or not os.path.exists(base_path):
-                continue
-            valid_paths.append(base_path)
-            
-            for root, dirs, files in os.walk(base_path):
-                if any(x in root.lower() for x in ['appdata\\local\\microsoft\\windows', 'ntuser', '$recycle']):
-                    continue
-                total_files += len(files)
-        
-        if total_files == 0:
-            return large_files
-        
-        # Scan files with progress
-        self.root.after(0, lambda: self.progress.config(maximum=total_files))
-        current_file = 0
+        # Overlapping roots (e.g. user profile and Downloads) are collapsed
+        # up front; the walk itself never visits a file twice
+        valid_paths = _collapse_nested(base_path for base_path in scan_paths
+                                       if base_path and os.path.exists(base_path)
+                                       and not _is_excluded_scan_dir(base_path))
+        if not valid_paths:
+            return []
+        
+        # The tree is walked once, so there is no total to measure against:
+        # the bar just shows activity and the status counts files checked.
+        # Workers add their per-directory file counts to state; at most
+        # SCAN_PROGRESS_HZ updates per second are posted to the UI queue
+        state = {'cur': 0, 'posted': 0.0}
+        lock = threading.Lock()
+        
+        def update_progress(count):
+            with lock:
+                state['cur'] += count
+                now = time.monotonic()
+                if now - state['posted'] < 1.0 / SCAN_PROGRESS_HZ:
+                    return
+                state['posted'] = now
+                self._post('status', f"📊 Scanning... {state['cur']:,} files checked")
         
-        for base_path in valid_paths:
-            for root, dirs, files in os.walk(base_path):
-                if any(x in root.lower() for x in ['appdata\\local\\microsoft\\windows', 'ntuser', '$recycle']):
-                    continue
-                    
-                for name in files:
-                    current_file += 1
-                    if current_file % 100 == 0:  # Update progress every 100 files
-                        progress_val = (current_file / total_files) * 100
-                        self.root.after(0, lambda p=progress_val: self.progress.config(value=current_file))
-                        self.root.after(0, lambda: self.update_status(f"Scanning... {current_file:,}/{total_files:,} files"))
-                    
-                    try:
-                        filepath = os.path.join(root, name)
-                        if filepath in seen_files:
-                            continue
-                        seen_files.add(filepath)
-                        
-                        size = os.path.getsize(filepath)
-                        if size >= min_size_mb * 1024 * 1024:
-                            large_files.append((filepath, size))
-                    except (OSError, PermissionError):
-                        if root not in skipped_dirs:
-                            skipped_dirs.append(root)
-                        continue
+        self.set_progress_busy(True)
+        try:
+            found, skipped_dirs = _find_large_files_parallel(valid_paths, min_size_mb * 1024 * 1024,
+                                                             _is_excluded_scan_dir, update_progress,
+                                                             cancel=self._cancel)
+        finally:
+            self.set_progress_busy(False)
         
-        self.root.after(0, lambda: self.progress.config(value=total_files))
         if skipped_dirs:
             self.log_output(f"Note: Skipped {len(skipped_dirs)} directories due to access restrictions")
         
-        return large_files
+        return found
     
     def show_file_selection(self):
         """Show enhanced file selection window with safety features"""
@@ -2168,13 +3197,11 @@ class CleanupGUI:
     def populate_file_tree(self):
         """Populate the file tree with enhanced file information"""
         # Clear existing items
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        self.file_tree.delete(*self.file_tree.get_children())
         
         # Initialize file data with safety analysis
         self.file_data = []
-        from cScan import FileAnalyzer
-        analyzer = FileAnalyzer()
+        analyzer = get_file_analyzer()
         
         for filepath, size in self.large_files:
             file_info = analyzer.get_file_info(filepath)
@@ -2194,7 +3221,7 @@ class CleanupGUI:
                 self.file_data.append(file_entry)
         
         # Sort by size (largest first)
-        self.file_data.sort(key=lambda x: -x['size'])
+        self.file_data.sort(key=itemgetter('size'), reverse=True)
         
         # Populate tree
         self.refresh_file_tree()
@@ -2202,11 +3229,11 @@ class CleanupGUI:
     def refresh_file_tree(self):
         """Refresh the file tree display based on current filter"""
         # Clear tree
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        self.file_tree.delete(*self.file_tree.get_children())
         
-        # Apply current filter
+        # Apply current filter; row iids are indexes into visible_files
         filtered_files = self.apply_filter(self.file_data)
+        self.visible_files = filtered_files
         
         # Add filtered files to tree
         for i, file_entry in enumerate(filtered_files):
@@ -2222,7 +3249,7 @@ class CleanupGUI:
             )
             
             # Insert with tags for styling
-            item = self.file_tree.insert('', tk.END, values=values, tags=(file_entry['safety'],))
+            self.file_tree.insert('', tk.END, iid=i, values=values, tags=(file_entry['safety'],))
             
         # Configure tags for safety coloring
         self.file_tree.tag_configure('safe', foreground=self.colors['success'])
@@ -2230,6 +3257,11 @@ class CleanupGUI:
         self.file_tree.tag_configure('unknown', foreground=self.colors['text'])
         self.file_tree.tag_configure('critical', foreground=self.colors['danger'])
     
+    def update_select_column(self):
+        """Redraw the Select cells of the visible rows without rebuilding the tree"""
+        for i, file_entry in enumerate(self.visible_files):
+            self.file_tree.set(i, 'Select', "☑️" if file_entry['selected'] else "☐")
+    
     def apply_filter(self, files):
         """Apply the current filter to file list"""
         filter_value = self.filter_var.get()
@@ -2243,8 +3275,7 @@ class CleanupGUI:
         elif filter_value == "Large (>1GB)":
             return [f for f in files if f['size'] > 1024*1024*1024]
         elif filter_value == "Recent (<7 days)":
-            from datetime import datetime, timedelta
-            week_ago = datetime.now() - timedelta(days=7)
+            week_ago = time.time() - 7 * 24 * 3600
             return [f for f in files if f['modified'] > week_ago]
         
         return files
@@ -2261,21 +3292,19 @@ class CleanupGUI:
             return
         
         # Get the row index
-        row_index = self.file_tree.index(item)
-        filtered_files = self.apply_filter(self.file_data)
+        row_index = int(item)
         
-        if row_index < len(filtered_files):
-            file_entry = filtered_files[row_index]
+        if row_index < len(self.visible_files):
+            file_entry = self.visible_files[row_index]
             
             # Check if click was on the select column
             region = self.file_tree.identify_region(event.x, event.y)
             if region == "cell":
                 column = self.file_tree.identify_column(event.x, event.y)
                 if column == '#1':  # Select column
-                    # Toggle selection
-                    original_file = next(f for f in self.file_data if f['path'] == file_entry['path'])
-                    original_file['selected'] = not original_file['selected']
-                    self.refresh_file_tree()
+                    # Toggle selection; only this row's cell changes
+                    file_entry['selected'] = not file_entry['selected']
+                    self.file_tree.set(item, 'Select', "☑️" if file_entry['selected'] else "☐")
                     self.update_selection_summary()
                     return
             
@@ -2299,7 +3328,7 @@ class CleanupGUI:
 
 🛡️ Safety Level: {file_entry['safety_icon']} {file_entry['safety'].title()}
 
-📅 Last Modified: {file_entry['modified'].strftime('%Y-%m-%d %H:%M:%S')}
+📅 Last Modified: {datetime.fromtimestamp(file_entry['modified']).strftime('%Y-%m-%d %H:%M:%S')}
 
 💡 Safety Notes:"""
         
@@ -2347,14 +3376,14 @@ class CleanupGUI:
         for file_entry in self.file_data:
             if file_entry['safety'] in ['safe', 'cache', 'temp']:
                 file_entry['selected'] = True
-        self.refresh_file_tree()
+        self.update_select_column()
         self.update_selection_summary()
     
     def clear_all_selections(self):
         """Clear all file selections"""
         for file_entry in self.file_data:
             file_entry['selected'] = False
-        self.refresh_file_tree()
+        self.update_select_column()
         self.update_selection_summary()
     
     def show_type_selector(self):
@@ -2396,7 +3425,7 @@ class CleanupGUI:
                 file_entry['selected'] = True
         
         type_window.destroy()
-        self.refresh_file_tree()
+        self.update_select_column()
         self.update_selection_summary()
     
     def show_file_details(self, event):
@@ -2405,11 +3434,10 @@ class CleanupGUI:
         if not item:
             return
         
-        row_index = self.file_tree.index(item)
-        filtered_files = self.apply_filter(self.file_data)
+        row_index = int(item)
         
-        if row_index < len(filtered_files):
-            file_entry = filtered_files[row_index]
+        if row_index < len(self.visible_files):
+            file_entry = self.visible_files[row_index]
             
             # Create detailed info window
             detail_window = tk.Toplevel(self.root)
@@ -2437,7 +3465,7 @@ class CleanupGUI:
 🛡️ Safety Level: {file_entry['safety_icon']} {file_entry['safety'].title()}
 
 📅 Created: {datetime.fromtimestamp(file_stats.st_ctime).strftime('%Y-%m-%d %H:%M:%S')}
-📅 Modified: {file_entry['modified'].strftime('%Y-%m-%d %H:%M:%S')}
+📅 Modified: {datetime.fromtimestamp(file_entry['modified']).strftime('%Y-%m-%d %H:%M:%S')}
 📅 Accessed: {datetime.fromtimestamp(file_stats.st_atime).strftime('%Y-%m-%d %H:%M:%S')}
 
 💡 SAFETY ASSESSMENT:
@@ -2529,8 +3557,8 @@ class CleanupGUI:
         """Perform the actual file deletion with safety measures"""
         self.log_output(f"\n🎯 Starting {deletion_mode} deletion for {len(selected_files)} files:", "header")
         
-        # Initialize the safe delete manager
-        from cScan import SafeDeleteManager, ConfigManager
+        # Initialize the safe delete manager; it gets its own ConfigManager
+        # because the deletion mode overrides settings below
         config = ConfigManager()
         
         # Configure deletion mode
@@ -2544,9 +3572,15 @@ class CleanupGUI:
         safe_delete = SafeDeleteManager(config)
         
         # Progress tracking
-        self.progress.config(maximum=len(selected_files), value=0)
+        self.set_progress(maximum=len(selected_files), value=0)
         self.update_status(f"Safely deleting files...")
         
+        # Run on the worker thread; progress and log lines reach the widgets
+        # through the UI queue, so the window keeps redrawing during deletion
+        self.submit_job(self.safe_deletion_thread, safe_delete, selected_files, deletion_mode)
+    
+    def safe_deletion_thread(self, safe_delete, selected_files, deletion_mode):
+        """Delete files through SafeDeleteManager in separate thread"""
         success_count = 0
         total_freed = 0
         failed_files = []
@@ -2560,56 +3594,53 @@ class CleanupGUI:
             'total_size': 0
         }
         
-        for i, file_entry in enumerate(selected_files):
-            filepath = file_entry['path']
-            size = file_entry['size']
-            
-            # Convert to format expected by safe_delete
-            file_info = {
-                'size': size,
-                'category': file_entry['category'],
-                'safety': file_entry['safety'],
-                'modified': file_entry['modified']
-            }
-            
+        # Convert to format expected by delete_many
+        file_infos = [{
+            'path': file_entry['path'],
+            'size': file_entry['size'],
+            'category': file_entry['category'],
+            'safety': file_entry['safety'],
+            'modified': file_entry['modified']
+        } for file_entry in selected_files]
+        
+        done = 0
+        for start in range(0, len(file_infos), GUI_DELETE_CHUNK):
+            chunk = file_infos[start:start + GUI_DELETE_CHUNK]
             try:
-                success, message = safe_delete.safe_delete(filepath, file_info)
+                results = safe_delete.delete_many(chunk)
+            except Exception as e:
+                for file_info in chunk:
+                    failed_files.append((file_info['path'], str(e)))
+                    self.log_output(f"❌ Error: {os.path.basename(file_info['path'])} - {e}", "error")
+                results = []
+            
+            for file_info, success, message in results:
+                filepath = file_info['path']
+                size = file_info['size']
+                filename = os.path.basename(filepath)
                 
                 if success:
                     success_count += 1
                     total_freed += size
-                    filename = os.path.basename(filepath)
                     self.log_output(f"✅ {deletion_mode.title()}: {get_size_readable(size)} - {filename}", "success")
-                    
-                    # Add to session log
-                    session_log['files'].append({
-                        'path': filepath,
-                        'size': size,
-                        'category': file_entry['category'],
-                        'safety': file_entry['safety'],
-                        'status': 'success'
-                    })
+                    status = 'success'
                 else:
                     failed_files.append((filepath, message))
-                    filename = os.path.basename(filepath)
                     self.log_output(f"❌ Failed: {filename} - {message}", "error")
-                    
-                    session_log['files'].append({
-                        'path': filepath,
-                        'size': size,
-                        'category': file_entry['category'],
-                        'safety': file_entry['safety'],
-                        'status': f'failed: {message}'
-                    })
-                    
-            except Exception as e:
-                failed_files.append((filepath, str(e)))
-                filename = os.path.basename(filepath)
-                self.log_output(f"❌ Error: {filename} - {e}", "error")
+                    status = f'failed: {message}'
+                
+                # Add to session log
+                session_log['files'].append({
+                    'path': filepath,
+                    'size': size,
+                    'category': file_info['category'],
+                    'safety': file_info['safety'],
+                    'status': status
+                })
             
             # Update progress
-            self.progress.config(value=i + 1)
-            self.root.update_idletasks()
+            done += len(chunk)
+            self.set_progress(value=done)
         
         # Update session log totals
         session_log['success_count'] = success_count
@@ -2641,10 +3672,10 @@ class CleanupGUI:
         
         # Show undo information
         if success_count > 0:
-            self.show_undo_info(deletion_mode, success_count, total_freed)
+            self._post('call', lambda: self.show_undo_info(deletion_mode, success_count, total_freed))
         
         # Re-enable buttons
-        self.enable_cleanup_buttons()
+        self._post('call', self.enable_cleanup_buttons)
     
     def save_deletion_session(self, session_log):
         """Save deletion session for potential undo operations"""
@@ -2781,39 +3812,43 @@ To restore files:
     def delete_files_with_progress(self, files_to_delete):
         """Delete files with progress feedback"""
         self.update_status("Deleting files...")
-        self.progress.config(maximum=len(files_to_delete), value=0)
-        
-        deleted_count = 0
-        deleted_size = 0
+        self.set_progress(maximum=len(files_to_delete), value=0)
+        
+        # Run on the worker thread; Tk drains the results from the UI queue
+        self.submit_job(self.delete_files_thread, files_to_delete)
+    
+    def delete_files_thread(self, files_to_delete):
+        """Delete files in separate thread, posting each result to the UI queue"""
+        # Results may arrive from several deletion workers at once
+        lock = threading.Lock()
+        counts = Counter()
+        
+        def on_result(filepath, size, error):
+            filename = filepath.split('/')[-1].split('\\')[-1]
+            with lock:
+                counts['processed'] += 1
+                if error is None:
+                    counts['deleted'] += 1
+                    counts['bytes'] += size
+                    self.log_output(f"✅ Deleted: {get_size_readable(size)} - {filename}", "success")
+                else:
+                    self.log_output(f"❌ Failed to delete: {filename} - {error}", "error")
+                self.set_progress(value=counts['processed'])
         
-        for i, (filepath, size) in enumerate(files_to_delete):
-            try:
-                os.remove(filepath)
-                deleted_count += 1
-                deleted_size += size
-                filename = filepath.split('/')[-1].split('\\')[-1]
-                self.log_output(f"✅ Deleted: {get_size_readable(size)} - {filename}", "success")
-            except Exception as e:
-                filename = filepath.split('/')[-1].split('\\')[-1]
-                self.log_output(f"❌ Failed to delete: {filename} - {e}", "error")
-            
-            self.progress.config(value=i + 1)
-            self.root.update_idletasks()
+        _remove_files(files_to_delete, on_result)
         
-        self.total_freed += deleted_size
-        self.log_output(f"\n🎉 Successfully deleted {deleted_count} files, freed {get_size_readable(deleted_size)}", "success")
+        self.total_freed += counts['bytes']
+        self.log_output(f"\n🎉 Successfully deleted {counts['deleted']} files, freed {get_size_readable(counts['bytes'])}", "success")
         
-        self.enable_cleanup_buttons()
+        self._post('call', self.enable_cleanup_buttons)
     
     def clean_temp_files(self):
         """Clean temporary files"""
         self.clean_temp_btn.config(state='disabled')
         self.update_status("Cleaning temporary files...")
         
-        # Run in separate thread
-        thread = threading.Thread(target=self.clean_temp_thread)
-        thread.daemon = True
-        thread.start()
+        # Run on the worker thread
+        self.submit_job(self.clean_temp_thread)
     
     def clean_temp_thread(self):
         """Clean temp files in separate thread"""
@@ -2821,30 +3856,35 @@ To restore files:
             freed = clear_temp_dirs()
             self.total_freed += freed
             self.log_output(f"Temp cleanup complete. Freed: {get_size_readable(freed)}")
-            self.root.after(0, lambda: self.clean_temp_btn.config(state='normal'))
+            self._post('call', lambda: self.clean_temp_btn.config(state='normal'))
         except Exception as e:
             self.log_output(f"Error cleaning temp files: {e}")
-            self.root.after(0, lambda: self.clean_temp_btn.config(state='normal'))
+            self._post('call', lambda: self.clean_temp_btn.config(state='normal'))
     
     def empty_recycle_bin(self):
         """Empty the recycle bin"""
+        # Confirm here rather than at the console prompt, which would block
+        # the worker thread and every job queued behind it
+        trash_name = "Recycle Bin" if IS_WINDOWS else "Trash"
+        if not messagebox.askyesno("Confirm Empty",
+                                   f"Permanently delete everything in the {trash_name}?"):
+            return
+        
         self.empty_recycle_btn.config(state='disabled')
         self.update_status("Emptying recycle bin...")
         
-        # Run in separate thread
-        thread = threading.Thread(target=self.empty_recycle_thread)
-        thread.daemon = True
-        thread.start()
+        # Run on the worker thread
+        self.submit_job(self.empty_recycle_thread)
     
     def empty_recycle_thread(self):
         """Empty recycle bin in separate thread"""
         try:
-            empty_recycle_bin()
+            empty_recycle_bin(ask=lambda prompt: 'y')
             self.log_output("Recycle bin operation complete.")
-            self.root.after(0, lambda: self.empty_recycle_btn.config(state='normal'))
+            self._post('call', lambda: self.empty_recycle_btn.config(state='normal'))
         except Exception as e:
             self.log_output(f"Error with recycle bin: {e}")
-            self.root.after(0, lambda: self.empty_recycle_btn.config(state='normal'))
+            self._post('call', lambda: self.empty_recycle_btn.config(state='normal'))
     
     def show_config(self):
         """Show the configuration editor GUI"""
@@ -2868,10 +3908,36 @@ To restore files:
         """Start the GUI"""
         self.root.mainloop()
 
+# Manual cleanup suggestions shown to non-admin CLI users
+MANUAL_CLEANUP_TIPS = (
+    "Clear browser cache (Chrome: Settings > Privacy > Clear browsing data)",
+    "Clean up browser downloads",
+)
+if IS_WINDOWS:
+    MANUAL_CLEANUP_TIPS += (
+        "Remove old Windows.old folders (if any in user space)",
+        "Clean %LOCALAPPDATA%\\Microsoft\\Windows\\Explorer\\thumbcache_*.db",
+        "Use Disk Cleanup tool (cleanmgr.exe) for system files",
+    )
+elif IS_MAC:
+    MANUAL_CLEANUP_TIPS += (
+        "Clear ~/Library/Caches/ subdirectories",
+        "Remove old iOS device backups (~/Library/Application Support/MobileSync/Backup/)",
+        "Clean Xcode derived data (~/Library/Developer/Xcode/DerivedData/)",
+        "Use Storage Management (Apple Menu > About This Mac > Storage > Manage)",
+    )
+else:
+    MANUAL_CLEANUP_TIPS += (
+        "Clear ~/.cache/ subdirectories",
+        "Remove old package manager caches (apt, yum, dnf)",
+        "Clean ~/.local/share/Trash/ manually",
+        "Use system cleanup tools (bleachbit, etc.)",
+    )
+
 # === Main ===
 if __name__ == "__main__":
     # Initialize configuration
-    config = ConfigManager()
+    config = get_config()
     
     # Display header with platform info
     platform_name = "Windows" if IS_WINDOWS else "macOS" if IS_MAC else "Linux"
@@ -2882,8 +3948,11 @@ if __name__ == "__main__":
         config.show_config_editor()
         sys.exit()
     
+    # Typed snapshot of the settings read below
+    cfg = config.freeze()
+    
     # Determine interface based on config
-    default_interface = config.get('Settings', 'default_interface', 'ask')
+    default_interface = cfg.default_interface
     
     if default_interface == 'ask':
         # Ask for interface preference
@@ -2944,34 +4013,42 @@ if __name__ == "__main__":
         total_freed = 0
 
         # 1. Find large files (using config threshold)
-        large_file_threshold = config.getint('Settings', 'large_file_threshold_mb', 100)
+        large_file_threshold = cfg.large_file_threshold_mb
         
-        # Use enhanced scanner
+        # Use enhanced scanner, reporting files as each directory tree finishes
         scanner = SmartFileScanner(config)
-        large_files_info, file_data = scanner.scan_files(accessible_paths, large_file_threshold)
+        large_files_info = []
+        file_data = defaultdict(list)
+        category_sizes = Counter()
+        for info in scanner.iter_large_files(accessible_paths, large_file_threshold):
+            large_files_info.append(info)
+            file_data[info['category']].append(info)
+            category_sizes[info['category']] += info['size']
+            print(f"\rScanning... {len(large_files_info)} large files found", end='', flush=True)
         
         if large_files_info:
-            # Convert to original format for compatibility
-            large_files = [(info['path'], info['size']) for info in large_files_info]
+            print()  # End the running count line
             
-            max_display = config.getint('Settings', 'max_files_to_display', 50)
-            print(f"\nFound {len(large_files)} large files:")
-            for info in sorted(large_files_info, key=lambda x: -x['size'])[:max_display]:
-                safety_icon = {'safe': '✓', 'user': '?', 'unknown': '!', 'critical': '✗'}.get(info['safety'], '?')
-                print(f"  {get_size_readable(info['size']):>10} {safety_icon} [{info['category']}] - {info['path']}")
+            max_display = cfg.max_files_to_display
+            print(f"\nFound {len(large_files_info)} large files:")
+            # One write for the whole listing rather than one per row
+            rows = [f"  {get_size_readable(info['size']):>10} {SAFETY_ICONS.get(info['safety'], '?')} "
+                    f"[{info['category']}] - {info['path']}"
+                    for info in heapq.nlargest(max_display, large_files_info, key=itemgetter('size'))]
+            print('\n'.join(rows))
             
-            if len(large_files) > max_display:
-                print(f"  ... and {len(large_files) - max_display} more files")
+            if len(large_files_info) > max_display:
+                print(f"  ... and {len(large_files_info) - max_display} more files")
             
             # Show total size of large files
-            total_large = sum(size for _, size in large_files)
-            print(f"\nTotal size of large files: {get_size_readable(total_large)}")
+            print(f"\nTotal size of large files: {get_size_readable(sum(category_sizes.values()))}")
             
             # Ask if user wants to delete files
             delete_response = input("\nWould you like to delete some of these large files? (y/N): ").lower()
             if delete_response == 'y':
                 # Use the enhanced interactive deletion function
-                total_deleted_size = delete_large_files_interactive_enhanced(large_files_info, file_data)
+                total_deleted_size = delete_large_files_interactive_enhanced(large_files_info, file_data,
+                                                                            category_sizes)
                 total_freed += total_deleted_size
             else:
                 print("Skipping file deletion.")
@@ -2989,7 +4066,7 @@ if __name__ == "__main__":
         print("\n" + "="*50)
         
         # 2. Clear temp directories (using config default)
-        clean_temp_default = config.getboolean('Settings', 'clean_temp_by_default', True)
+        clean_temp_default = cfg.clean_temp_by_default
         if clean_temp_default:
             response = input("Clean user temporary files? (Y/n): ").lower()
             if response != 'n':
@@ -2998,7 +4075,7 @@ if __name__ == "__main__":
                 print(f"User temp cleanup complete. Freed: {get_size_readable(freed)}")
 
         # 3. Empty Recycle Bin (using config default)
-        clean_recycle_default = config.getboolean('Settings', 'clean_recycle_by_default', True)
+        clean_recycle_default = cfg.clean_recycle_by_default
         if clean_recycle_default:
             freed = empty_recycle_bin()
             total_freed += freed
@@ -3006,23 +4083,7 @@ if __name__ == "__main__":
         # Additional suggestions for non-admin users
         if not is_admin():
             print(f"\nAdditional cleanup suggestions (manual):")
-            print("  • Clear browser cache (Chrome: Settings > Privacy > Clear browsing data)")
-            print("  • Clean up browser downloads")
-            
-            if IS_WINDOWS:
-                print("  • Remove old Windows.old folders (if any in user space)")
-                print("  • Clean %LOCALAPPDATA%\\Microsoft\\Windows\\Explorer\\thumbcache_*.db")
-                print("  • Use Disk Cleanup tool (cleanmgr.exe) for system files")
-            elif IS_MAC:
-                print("  • Clear ~/Library/Caches/ subdirectories")
-                print("  • Remove old iOS device backups (~/Library/Application Support/MobileSync/Backup/)")
-                print("  • Clean Xcode derived data (~/Library/Developer/Xcode/DerivedData/)")
-                print("  • Use Storage Management (Apple Menu > About This Mac > Storage > Manage)")
-            else:
-                print("  • Clear ~/.cache/ subdirectories")
-                print("  • Remove old package manager caches (apt, yum, dnf)")
-                print("  • Clean ~/.local/share/Trash/ manually")
-                print("  • Use system cleanup tools (bleachbit, etc.)")
+            print('\n'.join(f"  • {tip}" for tip in MANUAL_CLEANUP_TIPS))
 
         print(f"\nTotal space freed: {get_size_readable(total_freed)}")
         print("Cleanup complete.")